@@ -84,7 +84,7 @@ class RootRenderer:
                             markers = options.get("markers")
                             show_markers = options.get("show_markers", True)
                             if markers and show_markers and hasattr(render_obj, "FindBin"):
-                                xs = array("d", [float(m) for m in markers])
+                                xs = array("d", map(float, markers))
                                 ys = array("d", [])
                                 for val in xs:
                                     try:
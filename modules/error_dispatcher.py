@@ -13,8 +13,13 @@ Architecture:
 
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import Callable, Optional
+import queue
+import types
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional
 from enum import Enum
 from datetime import datetime
 
@@ -27,6 +32,14 @@ class ErrorLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
+_LOG_LEVEL_MAP: dict[ErrorLevel, int] = {
+    ErrorLevel.INFO: logging.INFO,
+    ErrorLevel.WARNING: logging.WARNING,
+    ErrorLevel.ERROR: logging.ERROR,
+    ErrorLevel.CRITICAL: logging.CRITICAL,
+}
+
+
 class ErrorEvent:
     """Represents a single error event."""
     
@@ -44,23 +57,57 @@ class ErrorEvent:
         self.exception = exception
         self.data = data or {}
         self.timestamp = datetime.now()
+        # Resolve the exception type/message once; to_dict may run per event
+        if exception is not None:
+            self._exc_pair = (type(exception).__name__, str(exception))
+        else:
+            self._exc_pair = (None, None)
     
     def __str__(self) -> str:
         return f"[{self.level.value}] {self.context}: {self.message}"
     
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/storage."""
+        exc_type, exc_message = self._exc_pair
         return {
             "level": self.level.value,
             "message": self.message,
             "context": self.context,
             "timestamp": self.timestamp.isoformat(),
             "data": self.data,
-            "exception_type": type(self.exception).__name__ if self.exception else None,
-            "exception_message": str(self.exception) if self.exception else None,
+            "exception_type": exc_type,
+            "exception_message": exc_message,
         }
 
 
+def _make_handler_ref(handler: Callable[[ErrorEvent], None]) -> tuple[bool, Any]:
+    """Wrap a handler as an ``(is_weak, ref)`` entry.
+
+    Bound methods are held through ``weakref.WeakMethod`` so a subscribed
+    widget/tab can be garbage collected; plain callables are held strongly.
+    """
+    if isinstance(handler, types.MethodType):
+        return (True, weakref.WeakMethod(handler))
+    return (False, handler)
+
+
+def _make_level_emitter(level: ErrorLevel) -> Callable[..., ErrorEvent]:
+    """Build an ``emit`` variant with the level bound in."""
+
+    def emit_level(
+        self: ErrorDispatcher,
+        message: str,
+        context: str = "unknown",
+        exception: Optional[Exception] = None,
+        data: Optional[dict] = None,
+    ) -> ErrorEvent:
+        return self.emit(level, message, context, exception, data)
+
+    emit_level.__name__ = emit_level.__qualname__ = f"emit_{level.name.lower()}"
+    emit_level.__doc__ = f"Emit a {level.value} event (same arguments as ``emit`` minus level)."
+    return emit_level
+
+
 class ErrorDispatcher:
     """Centralized error dispatcher for the application.
     
@@ -71,17 +118,24 @@ class ErrorDispatcher:
         dispatcher = ErrorDispatcher.get_instance()
         dispatcher.subscribe(ErrorLevel.ERROR, my_error_handler)
         dispatcher.emit(ErrorLevel.WARNING, "Operation failed", "module_name", exception=e)
+        dispatcher.emit_warning("Operation failed", "module_name", exception=e)
     """
     
     _instance: Optional[ErrorDispatcher] = None
     
     def __init__(self) -> None:
         """Initialize error dispatcher with logging setup."""
-        self._handlers: dict[ErrorLevel, list[Callable[[ErrorEvent], None]]] = {
+        self._handlers: dict[ErrorLevel, list[tuple[bool, Any]]] = {
             level: [] for level in ErrorLevel
         }
+        # Immutable snapshots iterated by emit; rebuilt only on (un)subscribe
+        self._handler_tuples: dict[ErrorLevel, tuple[tuple[bool, Any], ...]] = {
+            level: () for level in ErrorLevel
+        }
         self._error_history: list[ErrorEvent] = []
         self._max_history = 100
+        self._log_listener: Optional[QueueListener] = None
+        self._log_queue_handler: Optional[QueueHandler] = None
         self._logger = self._setup_logging()
     
     @classmethod
@@ -97,7 +151,11 @@ class ErrorDispatcher:
         cls._instance = None
     
     def _setup_logging(self) -> logging.Logger:
-        """Set up Python logging for error dispatch."""
+        """Set up Python logging for error dispatch.
+        
+        Records are handed to a QueueHandler and written to stderr by a
+        QueueListener thread, so emitting never blocks on stream I/O.
+        """
         logger = logging.getLogger("HPGeGUI")
         if not logger.handlers:
             handler = logging.StreamHandler()
@@ -105,10 +163,28 @@ class ErrorDispatcher:
                 "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             )
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.DEBUG)
+            log_queue: queue.Queue = queue.Queue(-1)
+            self._log_listener = QueueListener(log_queue, handler)
+            self._log_listener.start()
+            self._log_queue_handler = QueueHandler(log_queue)
+            logger.addHandler(self._log_queue_handler)
+            # Events start at INFO; DEBUG is opt-in and adds tracebacks
+            logger.setLevel(logging.INFO)
+            # Flush queued records on interpreter exit
+            atexit.register(self.shutdown)
         return logger
     
+    def shutdown(self) -> None:
+        """Stop the background log listener after flushing queued records."""
+        listener = self._log_listener
+        if listener is None:
+            return
+        self._log_listener = None
+        if self._log_queue_handler is not None:
+            self._logger.removeHandler(self._log_queue_handler)
+            self._log_queue_handler = None
+        listener.stop()
+    
     def subscribe(
         self,
         level: ErrorLevel,
@@ -116,12 +192,17 @@ class ErrorDispatcher:
     ) -> None:
         """Subscribe a handler to errors of a specific level.
         
+        Bound methods are referenced weakly: once their owner is garbage
+        collected the handler is skipped and pruned on the next emit.
+        
         Args:
             level: ErrorLevel to listen for
             handler: Callable that receives ErrorEvent
         """
-        if handler not in self._handlers[level]:
-            self._handlers[level].append(handler)
+        handlers = self._handlers[level]
+        if self._find_handler(handlers, handler) < 0:
+            handlers.append(_make_handler_ref(handler))
+            self._handler_tuples[level] = tuple(handlers)
     
     def unsubscribe(
         self,
@@ -129,8 +210,32 @@ class ErrorDispatcher:
         handler: Callable[[ErrorEvent], None],
     ) -> None:
         """Unsubscribe a handler from a specific level."""
-        if handler in self._handlers[level]:
-            self._handlers[level].remove(handler)
+        handlers = self._handlers[level]
+        idx = self._find_handler(handlers, handler)
+        if idx >= 0:
+            del handlers[idx]
+            self._handler_tuples[level] = tuple(handlers)
+    
+    @staticmethod
+    def _find_handler(
+        handlers: list[tuple[bool, Any]],
+        handler: Callable[[ErrorEvent], None],
+    ) -> int:
+        """Return the index of the entry wrapping ``handler``, or -1."""
+        for idx, (is_weak, ref) in enumerate(handlers):
+            target = ref() if is_weak else ref
+            if target is not None and target == handler:
+                return idx
+        return -1
+    
+    def _prune_handlers(self, level: ErrorLevel) -> None:
+        """Drop weak handler entries whose owner has been collected."""
+        handlers = self._handlers[level]
+        handlers[:] = [
+            entry for entry in handlers
+            if not entry[0] or entry[1]() is not None
+        ]
+        self._handler_tuples[level] = tuple(handlers)
     
     def emit(
         self,
@@ -155,13 +260,41 @@ class ErrorDispatcher:
         event = ErrorEvent(level, message, context, exception, data)
         
         # Log to Python logger
-        self._log_event(event)
+        self._log_event(event, _LOG_LEVEL_MAP[level])
         
         # Store in history
         self._store_in_history(event)
         
         # Invoke handlers for this level
-        for handler in self._handlers[level]:
+        self._invoke_handlers(level, event)
+        
+        return event
+    
+    # Level-specialized variants of emit for call sites with a fixed level
+    emit_info = _make_level_emitter(ErrorLevel.INFO)
+    emit_warning = _make_level_emitter(ErrorLevel.WARNING)
+    emit_error = _make_level_emitter(ErrorLevel.ERROR)
+    emit_critical = _make_level_emitter(ErrorLevel.CRITICAL)
+    
+    def debug_enabled(self) -> bool:
+        """Return True if the logger accepts DEBUG records.
+
+        Callers attach exceptions (and so tracebacks) to routine failures
+        only when this is set.
+        """
+        return self._logger.isEnabledFor(logging.DEBUG)
+    
+    def _invoke_handlers(self, level: ErrorLevel, event: ErrorEvent) -> None:
+        """Invoke handlers for a level, skipping collected weak handlers."""
+        needs_prune = False
+        for is_weak, ref in self._handler_tuples[level]:
+            if is_weak:
+                handler = ref()
+                if handler is None:
+                    needs_prune = True
+                    continue
+            else:
+                handler = ref
             try:
                 handler(event)
             except Exception as handler_error:
@@ -170,18 +303,17 @@ class ErrorDispatcher:
                     f"Error in error handler: {handler_error}",
                     exc_info=True
                 )
-        
-        return event
+        if needs_prune:
+            self._prune_handlers(level)
     
-    def _log_event(self, event: ErrorEvent) -> None:
-        """Log event to Python logger."""
-        log_level = {
-            ErrorLevel.INFO: logging.INFO,
-            ErrorLevel.WARNING: logging.WARNING,
-            ErrorLevel.ERROR: logging.ERROR,
-            ErrorLevel.CRITICAL: logging.CRITICAL,
-        }[event.level]
-        
+    def _log_event(self, event: ErrorEvent, log_level: int) -> None:
+        """Log event to Python logger.
+
+        Returns before formatting the message (or the traceback) when the
+        logger would drop the record anyway.
+        """
+        if not self._logger.isEnabledFor(log_level):
+            return
         log_message = str(event)
         if event.exception:
             self._logger.log(log_level, log_message, exc_info=event.exception)
@@ -7,13 +7,238 @@ so it can be reused by other parts of the application.
 
 from __future__ import annotations
 
+import difflib
+import math
 import os
+import re
 from datetime import datetime
+from itertools import chain, repeat
 import tkinter as tk
-from contextlib import redirect_stdout, redirect_stderr
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
 from tkinter import ttk, messagebox
+from types import MappingProxyType
+from typing import NamedTuple
+
+from .error_dispatcher import get_dispatcher
+
+# Gaussian annotation factors (rounded values, as used in the exports).
+_FWHM_PER_SIGMA = 2.355
+_SQRT_2PI = 2.506628
+
+# Sink for silencing ROOT output during fits, shared by every instance
+# for the life of the process
+_DEVNULL = open(os.devnull, "w")
+
+
+class CachedFitResult(NamedTuple):
+    """Fit results copied out of ROOT as native Python values.
+
+    Stored as fit_state["cached_results"]. A failed fit sets only `error`.
+    """
+
+    chi2: float = 0.0
+    ndf: int = 0
+    status: int = 0
+    parameters: tuple[float, ...] = ()
+    errors: tuple[float, ...] = ()
+    error: str | None = None
+    # Derived once at cache time; None when not applicable
+    reduced_chi2: float | None = None
+    fwhm: float | None = None
+    area: float | None = None
+    # Function and fit options (as typed) that were fitted; the UI may have changed since
+    fit_func: str | None = None
+    fit_options: str | None = None
+
+    @classmethod
+    def from_fit(
+        cls,
+        fit_func: str,
+        chi2: float,
+        ndf: int,
+        status: int,
+        parameters: tuple[float, ...],
+        errors: tuple[float, ...],
+        fit_options: str | None = None,
+    ) -> CachedFitResult:
+        """Build a successful result, deriving reduced chi2 and Gaussian FWHM/area."""
+        fwhm = area = None
+        if fit_func == "gaus" and len(parameters) >= 3:
+            fwhm = _FWHM_PER_SIGMA * parameters[2]
+            area = parameters[0] * parameters[2] * _SQRT_2PI
+        return cls(
+            chi2=chi2,
+            ndf=ndf,
+            status=status,
+            parameters=parameters,
+            errors=errors,
+            reduced_chi2=chi2 / ndf if ndf > 0 else None,
+            fwhm=fwhm,
+            area=area,
+            fit_func=fit_func,
+            fit_options=fit_options,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        if self.error is not None:
+            return {"error": self.error}
+        return {
+            "chi2": self.chi2,
+            "ndf": self.ndf,
+            "status": self.status,
+            "parameters": list(self.parameters),
+            "errors": list(self.errors),
+        }
+
+
+# Multi-letter TH1::Fit option keywords; their letters are not single-letter options.
+_FIT_OPTION_WORDS = re.compile(
+    r"MULTITHREAD|MULTIPROCESS|MULTIPROC|SERIAL|WIDTH|ROB(?:=[0-9.]*)?|EX0|WW|WL|LL|PL",
+    re.IGNORECASE,
+)
+
+
+def _set_fit_option_letters(option: str, letters: str) -> str:
+    """Return the fit `option` string with each single-letter option in `letters` given once.
+
+    Multi-letter keywords (SERIAL, MULTITHREAD, ...) are kept as typed, so
+    their letters are neither stripped nor taken for one of `letters`.
+    """
+    words = _FIT_OPTION_WORDS.findall(option)
+    singles = "".join(
+        ch for ch in _FIT_OPTION_WORDS.sub(" ", option)
+        if not ch.isspace() and ch.upper() not in letters
+    )
+    return " ".join((singles + letters, *words))
+
+
+# Shared cached_results for the common "no result" failure.
+_FIT_RESULT_NONE_ERROR = CachedFitResult(error="Fit result is None")
+
+# Parameter labels shown in the "Initial Parameters" frame per fit function.
+_PARAM_NAMES_MAP = MappingProxyType({
+    "gaus": ("Constant (p0)", "Mean (p1)", "Sigma (p2)"),
+    "landau": ("Constant (p0)", "Mean (p1)", "Width (p2)"),
+    "expo": ("Constant (p0)", "Slope (p1)"),
+    "pol1": ("a0 (p0)", "a1 (p1)"),
+    "pol2": ("a0 (p0)", "a1 (p1)", "a2 (p2)"),
+    "pol3": ("a0 (p0)", "a1 (p1)", "a2 (p2)", "a3 (p3)"),
+})
+
+# Function names shown in the "Initial Parameters" frame title.
+_FIT_FUNC_TITLES = MappingProxyType({
+    "gaus": "Gaussian",
+    "landau": "Landau",
+    "expo": "Exponential",
+    "pol1": "Linear",
+    "pol2": "Quadratic",
+    "pol3": "Cubic",
+})
+
+# Parameter names used in the fit results text per fit function.
+_PARAM_DISPLAY_NAMES = MappingProxyType({
+    "gaus": ("Constant", "Mean", "Sigma"),
+    "landau": ("Constant", "Mean", "Width"),
+    "expo": ("Constant", "Slope"),
+    "pol1": ("a0", "a1"),
+    "pol2": ("a0", "a1", "a2"),
+    "pol3": ("a0", "a1", "a2", "a3"),
+})
+
+# Names for parameters beyond a function's table (or of unknown functions).
+_FALLBACK_PARAM_NAMES = tuple(f"p[{i}]" for i in range(32))
+
+# Polynomial order of the ROOT polN fit functions.
+_POLY_ORDERS = MappingProxyType({"pol1": 1, "pol2": 2, "pol3": 3})
+
+
+def _poly_least_squares(xs: list[float], ys: list[float], order: int) -> list[float] | None:
+    """Least-squares polynomial coefficients a0..a_order for ys(xs).
+
+    Solves the normal equations in x centered on its mean (for
+    conditioning) and expands back to powers of x, matching ROOT's polN
+    parameter order. Returns None if the system is singular.
+    """
+    n = order + 1
+    if len(xs) < n:
+        return None
+    x0 = sum(xs) / len(xs)
+
+    # Normal equations: sums of u^(j+k) and y*u^j with u = x - x0
+    power_sums = [0.0] * (2 * order + 1)
+    rhs = [0.0] * n
+    for x, y in zip(xs, ys):
+        u = x - x0
+        term = 1.0
+        for k in range(2 * order + 1):
+            power_sums[k] += term
+            if k < n:
+                rhs[k] += y * term
+            term *= u
+    matrix = [[power_sums[j + k] for k in range(n)] + [rhs[j]] for j in range(n)]
+
+    # Gaussian elimination with partial pivoting
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(matrix[r][col]))
+        if abs(matrix[pivot][col]) < 1e-12 * max(abs(power_sums[0]), 1.0):
+            return None
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        for row in range(col + 1, n):
+            factor = matrix[row][col] / matrix[col][col]
+            for k in range(col, n + 1):
+                matrix[row][k] -= factor * matrix[col][k]
+    centered = [0.0] * n
+    for row in range(n - 1, -1, -1):
+        acc = matrix[row][n] - sum(matrix[row][k] * centered[k] for k in range(row + 1, n))
+        centered[row] = acc / matrix[row][row]
+
+    # sum_k c_k (x - x0)^k  ->  sum_m a_m x^m
+    return [
+        sum(centered[k] * math.comb(k, m) * (-x0) ** (k - m) for k in range(m, n))
+        for m in range(n)
+    ]
+
+
+def _read_tf1_arrays(func_obj, npar: int) -> tuple[list[float], list[float]]:
+    """Copy a TF1's parameters and errors into lists.
+
+    GetParameters()/GetParErrors() return double* views; sizing them and
+    copying in bulk avoids 2*npar GetParameter/GetParError calls. Falls
+    back to per-index access if the views cannot be sized.
+    """
+    try:
+        params_view = func_obj.GetParameters()
+        errors_view = func_obj.GetParErrors()
+        params_view.reshape((npar,))
+        errors_view.reshape((npar,))
+        return list(params_view), list(errors_view)
+    except (AttributeError, TypeError):
+        # Resolve the cppyy method proxies once, not once per index
+        get_param = func_obj.GetParameter
+        get_error = func_obj.GetParError
+        return (
+            [float(get_param(i)) for i in range(npar)],
+            [float(get_error(i)) for i in range(npar)],
+        )
+
 
-from .error_dispatcher import get_dispatcher, ErrorLevel
+def _text_line_edits(old: str, new: str) -> list[tuple[str, str, str]]:
+    """Tk Text edits that turn the shown text `old` into `new`, last edit first.
+
+    Each edit is (start, end, replacement) for Text.replace(). Edits
+    reaching the end of `old` end at "end-1c" so they never touch the
+    widget's trailing newline. Applying the edits in the returned order
+    keeps the line indices of the remaining edits valid.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    return [
+        (f"{i1 + 1}.0", f"{i2 + 1}.0" if i2 < len(old_lines) else "end-1c", "".join(new_lines[j1:j2]))
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes())
+        if tag != "equal"
+    ]
 
 
 class FittingFeature:
@@ -34,8 +259,18 @@ class FittingFeature:
         self.fit_states: dict[int, dict] = {}  # Store all fit states by fit ID
         self.fit_frames: dict[int, ttk.Frame] = {}  # Store fit frame widgets by fit ID
         self.current_fit_id: int | None = None
+        self._name_to_fit_id: dict[str, int] = {}  # Dropdown display name -> fit ID
+        self._visible_fit_id: int | None = None  # Fit whose frame is packed
+        self._fit_dropdown_values: list[str] = []  # Mirrors the dropdown's values
+        self._dropdown_batch_depth: int = 0  # Nesting depth of _dropdown_batch
+        self._batch_fit_name: str | None = None  # Last fit added inside a batch
         self.fit_dropdown_var: tk.StringVar | None = None
         self.title_label: ttk.Label | None = None
+        self._root = None  # ROOT module, resolved by _get_root_module
+        self._TF1 = None
+        self._gROOT = None
+        self._clone_epoch: int = 0  # Bumped whenever a new histogram is selected
+        self._hist_stats_cache: dict[int, dict] = {}  # id(clone) -> cached histogram lookups
 
     def __del__(self) -> None:
         """Clean up resources."""
@@ -43,8 +278,7 @@ class FittingFeature:
             pass
         except Exception as e:
             try:
-                self._dispatcher.emit(
-                    ErrorLevel.INFO,
+                self._dispatcher.emit_info(
                     "Error during FittingFeature cleanup",
                     context="FittingFeature.__del__",
                     exception=e
@@ -55,6 +289,10 @@ class FittingFeature:
 
     def build_ui(self, app, parent: ttk.Frame) -> None:
         self._app = app
+        # Resolve ROOT (and TF1/gROOT) up front when the app already loaded it;
+        # otherwise the first fit imports it
+        if getattr(app, "ROOT", None) is not None:
+            self._get_root_module(app)
         self.fit_frame = parent
         main_container = ttk.Frame(parent)
         main_container.pack(fill=tk.BOTH, expand=True)
@@ -100,21 +338,11 @@ class FittingFeature:
 
     def on_selection(self, app, obj, path: str) -> None:
         self.current_hist = obj
-        # Create a clone for fitting to avoid modifying the original
-        if obj is not None:
-            try:
-                clone_name = f"{obj.GetName()}_fit_clone" if hasattr(obj, "GetName") else "hist_fit_clone"
-                self.current_hist_clone = obj.Clone(clone_name)
-            except Exception as e:
-                self._dispatcher.emit(
-                    ErrorLevel.INFO,
-                    "Failed to clone histogram for fitting, using original",
-                    context="FittingFeature.on_selection",
-                    exception=e
-                )
-                self.current_hist_clone = obj
-        else:
-            self.current_hist_clone = None
+        self._hist_stats_cache.clear()
+        self._clone_epoch += 1  # Invalidates every fit's last_fit_key
+        # The fitting clone is created on the first fit (_get_clone),
+        # so browsing histograms does not pay for TH1::Clone
+        self.current_hist_clone = None
         # Update title with histogram name
         if obj is not None and self.title_label is not None:
             hist_name = obj.GetName() if hasattr(obj, "GetName") else "Histogram"
@@ -124,37 +352,65 @@ class FittingFeature:
         """Called when the Fit tab is shown."""
         pass  # No automatic preview needed anymore
 
-    def _create_peak_tab(self, idx: int, peak: dict) -> None:
-        """Create a tab for a detected peak with auto-filled energy and width."""
+    @staticmethod
+    def _estimate_peak_width(energy: float) -> float:
+        """Estimate width from peak FWHM (approximate as 5% of peak energy)."""
+        return max(energy * 0.05, 10)  # At least 10 keV width
+
+    @classmethod
+    def _format_peak_labels(cls, peaks: list[dict]) -> list[tuple[str, str]]:
+        """Format (tab text, info text) for every peak in a single pass."""
+        labels = []
+        for idx, peak in enumerate(peaks):
+            energy = peak.get("energy", 0)
+            labels.append((
+                f"Peak {idx+1} ({energy:.0f} keV)",
+                f"Energy: {energy:.2f} keV\n"
+                f"Counts: {peak.get('counts', 0):.1f}\n"
+                f"Est. Width: {cls._estimate_peak_width(energy):.2f} keV",
+            ))
+        return labels
+
+    def _create_peak_tab(self, idx: int, peak: dict, labels: tuple[str, str]) -> None:
+        """Add an empty tab for a detected peak.
+
+        `labels` is the pre-formatted (tab text, info text) pair from
+        `_format_peak_labels`. The tab content is built by `_build_peak_tab`
+        when the tab is first selected.
+        """
         energy = peak.get("energy", 0)
-        counts = peak.get("counts", 0)
-
-        # Estimate width from peak FWHM (approximate as 5% of peak energy)
-        estimated_width = max(energy * 0.05, 10)  # At least 10 keV width
+        tab_text, info_text = labels
 
         # Create tab frame
         tab_frame = ttk.Frame(self.peak_tabs_notebook)
-        self.peak_tabs_notebook.add(tab_frame, text=f"Peak {idx+1} ({energy:.0f} keV)")
+        self.peak_tabs_notebook.add(tab_frame, text=tab_text)
 
         # Store tab info
         self.peak_tabs[idx] = {
             "frame": tab_frame,
             "energy": energy,
-            "width": estimated_width,
+            "width": self._estimate_peak_width(energy),
             "index": idx,
+            "info_text": info_text,
+            "built": False,
         }
 
+    def _build_peak_tab(self, idx: int) -> None:
+        """Create the content of a peak tab with auto-filled energy and width."""
+        entry = self.peak_tabs[idx]
+        if entry["built"]:
+            return
+        entry["built"] = True
+
         # Create content
-        content = ttk.Frame(tab_frame)
+        content = ttk.Frame(entry["frame"])
         content.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
         # Peak info
         info_frame = ttk.LabelFrame(content, text="Peak Information", padding=4)
         info_frame.pack(fill=tk.X, pady=(0, 8))
 
-        ttk.Label(info_frame, text=f"Energy: {energy:.2f} keV").pack(anchor="w")
-        ttk.Label(info_frame, text=f"Counts: {counts:.1f}").pack(anchor="w")
-        ttk.Label(info_frame, text=f"Est. Width: {estimated_width:.2f} keV").pack(anchor="w")
+        ttk.Label(info_frame, text=entry["info_text"], justify=tk.LEFT).pack(anchor="w")
 
         # Fit button
         ttk.Button(
@@ -193,24 +449,29 @@ class FittingFeature:
                     try:
                         self.peak_tabs_notebook.forget(tab_id)
                     except Exception as e:
-                        self._dispatcher.emit(
-                            ErrorLevel.INFO,
+                        self._dispatcher.emit_info(
                             "Failed to remove peak notebook tab",
                             context="FittingFeature.set_peaks",
                             exception=e
                         )
         except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.WARNING,
+            self._dispatcher.emit_warning(
                 "Failed to clear peak tabs",
                 context="FittingFeature.set_peaks",
                 exception=e
             )
 
+        # Forgotten tabs are not destroyed by the notebook
+        for entry in self.peak_tabs.values():
+            entry["frame"].destroy()
         self.peak_tabs.clear()
 
+        # Tabs start empty; only the selected one is populated
+        peak_labels = self._format_peak_labels(self.detected_peaks)
         for idx, peak in enumerate(self.detected_peaks):
-            self._create_peak_tab(idx, peak)
+            self._create_peak_tab(idx, peak, peak_labels[idx])
+        if self.peak_tabs:
+            self._on_peak_tab_changed()
 
     def _on_peak_tab_changed(self) -> None:
         """Handle peak tab selection change."""
@@ -220,9 +481,9 @@ class FittingFeature:
                 tab_idx = self.peak_tabs_notebook.index(selected_tab)
                 if tab_idx in self.peak_tabs:
                     self.current_peak_index = tab_idx
+                    self._build_peak_tab(tab_idx)
         except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.INFO,
+            self._dispatcher.emit_info(
                 "Failed to handle peak tab change",
                 context="FittingFeature._on_peak_tab_changed",
                 exception=e
@@ -230,16 +491,20 @@ class FittingFeature:
 
     def _fit_peak(self, peak_idx: int) -> None:
         """Fit a specific detected peak by creating a new fit tab."""
-        if peak_idx not in self.peak_tabs:
+        try:
+            peak_data = self.peak_tabs[peak_idx]
+        except KeyError:
             return
 
-        peak_data = self.peak_tabs[peak_idx]
-
         # Create a new fit tab with the peak's energy and width pre-filled
         self._add_fit_tab(energy=peak_data["energy"], width=peak_data["width"], peak_idx=peak_idx)
 
     def _add_fit_tab(self, energy: float | None = None, width: float | None = None, peak_idx: int | None = None, auto_fit: bool = False) -> None:
-        """Create a new fit in the dropdown list."""
+        """Create a new fit in the dropdown list.
+
+        Only the fit state is created here; its widgets are built by
+        `_show_fit_frame` the first time the fit is displayed.
+        """
         self.fit_count += 1
         fit_id = self.fit_count  # Use fit number as unique identifier
 
@@ -247,37 +512,70 @@ class FittingFeature:
         if energy is not None:
             fit_name = f"Fit {self.fit_count} ({energy:.0f} keV)"
 
-        # Create fit UI within this fit and store fit_state globally
-        tab_frame = ttk.Frame(self.fit_container)
-        fit_state = self._create_fit_ui(tab_frame, energy=energy, width=width, peak_idx=peak_idx, fit_id=fit_id)
+        fit_state = self._new_fit_state(energy=energy, width=width, peak_idx=peak_idx, fit_id=fit_id)
+        fit_state["display_name"] = fit_name  # Key in _name_to_fit_id
         self.fit_states[fit_id] = fit_state  # Store globally for access across fits
-        self.fit_frames[fit_id] = tab_frame
-        fit_state["fit_frame"] = tab_frame
+        self._name_to_fit_id[fit_name] = fit_id
 
-        # Update dropdown with new fit
-        current_values = list(self.fit_dropdown.cget("values"))
-        current_values.append(fit_name)
-        self.fit_dropdown.config(values=current_values)
-        
-        # Select the new fit
-        self.fit_dropdown.set(fit_name)
-        self.current_fit_id = fit_id
-        self._on_fit_dropdown_changed()
+        # Update dropdown with new fit and select it (once per batch)
+        self._fit_dropdown_values.append(fit_name)
+        if self._dropdown_batch_depth:
+            self._batch_fit_name = fit_name
+        else:
+            self._select_fit_in_dropdown(fit_name)
 
         # If auto_fit is True, automatically perform the fit
         if auto_fit:
             self._app.after(100, lambda: self._perform_fit_for_tab(self._app, fit_state))
 
-    def _create_fit_ui(self, tab_frame: ttk.Frame, energy: float | None = None, width: float | None = None, peak_idx: int | None = None, fit_id: int | None = None) -> None:
-        """Create the fitting UI for a single fit."""
-        # Store fit-specific state
+    def _select_fit_in_dropdown(self, fit_name: str) -> None:
+        """Push the dropdown values to Tk and show the named fit."""
+        self.fit_dropdown.config(values=self._fit_dropdown_values)
+        self.fit_dropdown.set(fit_name)
+        self.current_fit_id = self._name_to_fit_id[fit_name]
+        self._on_fit_dropdown_changed()
+
+    def add_fits_bulk(self, specs: list[dict]) -> None:
+        """Add several fits with a single dropdown update.
+
+        Each spec holds the keyword arguments of `_add_fit_tab` (energy,
+        width, peak_idx, auto_fit). The dropdown is updated and the last
+        fit shown once, after all fits were added.
+        """
+        with self._dropdown_batch():
+            for spec in specs:
+                self._add_fit_tab(**spec)
+
+    @contextmanager
+    def _dropdown_batch(self):
+        """Defer dropdown updates of `_add_fit_tab` to the end of the outermost batch."""
+        self._dropdown_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._dropdown_batch_depth -= 1
+            if self._dropdown_batch_depth == 0 and self._batch_fit_name is not None:
+                fit_name, self._batch_fit_name = self._batch_fit_name, None
+                self._select_fit_in_dropdown(fit_name)
+
+    def _new_fit_state(self, energy: float | None = None, width: float | None = None, peak_idx: int | None = None, fit_id: int | None = None) -> dict:
+        """Create the state (variables and cached data) for a single fit."""
         fit_state = {
             "fit_id": fit_id,
+            "display_name": None,  # Dropdown entry, set by _add_fit_tab
             "fit_func_var": tk.StringVar(value="gaus"),
             "fit_options_var": tk.StringVar(value="SQ"),
             "energy_var": tk.StringVar(value=f"{energy:.2f}" if energy is not None else ""),
             "width_var": tk.StringVar(value=str(width) if width is not None else ""),
+            "built": False,  # Widgets are created on first display
+            "fit_frame": None,
             "params_frame": None,
+            "params_inner": None,
+            "_param_rows": [],  # Pooled (label, entry, checkbox, var, fixed_var) rows
+            "shown_fit_func": "gaus",  # Function the parameter rows are laid out for
+            "last_params": (),  # Stripped entry texts at the last refit trigger
+            # Start-value variables are created with their entry rows, so an
+            # unbuilt fit has none and fits from the default parameters
             "param_entries": [],
             "param_fixed_vars": [],
             "left_frame": None,
@@ -287,13 +585,26 @@ class FittingFeature:
             "fit_result": None,  # ROOT fit result object (short-lived)
             "cached_results": None,  # Native Python types (persistent)
             "fit_result_text": None,
+            "results_label": None,  # "Results" heading, marks a running fit
+            "_last_text": None,  # Text currently shown in fit_result_text
+            "_last_displayed": None,  # cached_results rendered into that text
             "refit_pending": {"id": None},
+            "write_epoch": 0,  # Incremented on every parameter edit
+            "pending_epoch": -1,  # write_epoch of the current burst, -1 when idle
+            "fast_preview": False,
             "peak_idx": peak_idx,
             "has_fit": False,
-            "fit_epoch": 0,
             "fit_func_obj": None,
+            "tf1_cache": {},  # fit_func -> TF1 reused across refits
+            "last_fit_key": None,  # Inputs of the last successful fit
+            "fit_token": 0,  # Incremented per requested fit; stale stages drop out
+            "_range_cache": None,  # (energy text, width text, (xmin, xmax))
+            "_params_cache": ((), ()),  # (entry texts, parsed non-empty values)
         }
+        return fit_state
 
+    def _create_fit_ui(self, tab_frame: ttk.Frame, fit_state: dict) -> None:
+        """Create the fitting UI for a single fit."""
         main_container = ttk.Frame(tab_frame)
         main_container.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
@@ -326,23 +637,14 @@ class FittingFeature:
         )
 
         # Parameters frame
-        fit_state["params_frame"] = ttk.LabelFrame(main_container, text="Initial Parameters (Gaussian)")
+        fit_state["params_frame"] = ttk.LabelFrame(main_container, text=self._params_frame_title(fit_state["shown_fit_func"]))
         fit_state["params_frame"].pack(fill=tk.X, pady=4)
 
-        param_names = ["Constant (p0)", "Mean (p1)", "Sigma (p2)"]
-        for i, name in enumerate(param_names):
-            ttk.Label(fit_state["params_frame"], text=f"{name}:").grid(row=0, column=i*3, sticky="e", padx=(4, 2))
-            var = tk.StringVar(value="")
-            entry = ttk.Entry(fit_state["params_frame"], textvariable=var, width=10)
-            entry.grid(row=0, column=i*3+1, sticky="w", padx=(0, 4))
-            var.trace_add("write", lambda *args, fs=fit_state: self._schedule_refit_for_tab(fs))
-
-            fixed_var = tk.BooleanVar(value=False)
-            checkbox = ttk.Checkbutton(fit_state["params_frame"], text="Fix", variable=fixed_var)
-            checkbox.grid(row=0, column=i*3+2, sticky="w", padx=(0, 12))
-
-            fit_state["param_entries"].append(var)
-            fit_state["param_fixed_vars"].append(fixed_var)
+        params_inner = ttk.Frame(fit_state["params_frame"])
+        params_inner.pack(fill=tk.X)
+        fit_state["params_inner"] = params_inner
+        self._layout_param_rows(fit_state, _PARAM_NAMES_MAP["gaus"])
+        fit_state["last_params"] = ("",) * len(fit_state["param_entries"])
 
         # Layout: preview on left, results on right
         content_frame = ttk.Frame(main_container)
@@ -359,7 +661,8 @@ class FittingFeature:
         fit_state["right_frame"].pack_propagate(False)
         fit_state["right_frame"].config(width=400)
 
-        ttk.Label(fit_state["right_frame"], text="Results", font=("TkDefaultFont", 10, "bold")).pack(anchor="w", padx=4, pady=(0, 4))
+        fit_state["results_label"] = ttk.Label(fit_state["right_frame"], text="Results", font=("TkDefaultFont", 10, "bold"))
+        fit_state["results_label"].pack(anchor="w", padx=4, pady=(0, 4))
 
         fit_state["fit_result_text"] = tk.Text(fit_state["right_frame"], height=12, wrap=tk.WORD, width=40)
         fit_state["fit_result_text"].pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
@@ -372,94 +675,188 @@ class FittingFeature:
 
         # Store fit state in frame for future reference (bidirectional)
         tab_frame.fit_state = fit_state
-
-        return fit_state
+        fit_state["fit_frame"] = tab_frame
+        fit_state["built"] = True
 
     def _on_fit_dropdown_changed(self) -> None:
         """Handle fit dropdown selection change."""
-        fit_name = self.fit_dropdown_var.get()
-        if not fit_name:
+        fit_id = self._name_to_fit_id.get(self.fit_dropdown_var.get())
+        if fit_id is None:
             return
-        
-        # Find fit_id from the fit name
-        for fit_id, fit_state in self.fit_states.items():
-            fit_display_name = f"Fit {fit_id}"
-            if "energy_var" in fit_state:
-                try:
-                    energy = float(fit_state["energy_var"].get().strip())
-                    fit_display_name = f"Fit {fit_id} ({energy:.0f} keV)"
-                except Exception as e:
-                    self._dispatcher.emit(
-                        ErrorLevel.INFO,
-                        "Failed to parse energy from fit state",
-                        context="FittingFeature._on_fit_dropdown_changed",
-                        exception=e
-                    )
-            if fit_display_name == fit_name:
-                self.current_fit_id = fit_id
-                self._show_fit_frame(fit_id)
-                return
+        self.current_fit_id = fit_id
+        self._show_fit_frame(fit_id)
+
+    def clear_fits(self) -> None:
+        """Drop all fits and reset the fit counter and dropdown."""
+        for fit_state in self.fit_states.values():
+            fit_state["fit_token"] += 1  # Cancels fit stages still queued
+        self.fit_states.clear()
+        for frame in self.fit_frames.values():
+            frame.destroy()
+        self.fit_frames.clear()
+        self._name_to_fit_id.clear()
+        self.fit_count = 0
+        self.current_fit_id = None
+        self._visible_fit_id = None
+        self._fit_dropdown_values.clear()
+        self._batch_fit_name = None
+        if getattr(self, "fit_dropdown", None) is not None:
+            self.fit_dropdown.config(values=[])
+        if self.fit_dropdown_var is not None:
+            self.fit_dropdown_var.set("")
 
     def _show_fit_frame(self, fit_id: int) -> None:
         """Show the fit frame for the given fit_id."""
-        # Hide all fit frames
-        for frame in self.fit_frames.values():
-            frame.pack_forget()
-        
+        if fit_id == self._visible_fit_id:
+            return
+        try:
+            fit_state = self.fit_states[fit_id]
+        except KeyError:
+            return
+
+        # Only the previously shown frame is packed
+        previous = self.fit_frames.get(self._visible_fit_id)
+        if previous is not None:
+            previous.pack_forget()
+
+        # Build the fit's widgets on first display
+        if not fit_state["built"]:
+            tab_frame = ttk.Frame(self.fit_container)
+            self._create_fit_ui(tab_frame, fit_state)
+            self.fit_frames[fit_id] = tab_frame
+            # Show results of a fit that ran while this one was hidden
+            self._display_fit_results_for_tab(fit_state)
+
         # Show the selected fit frame
-        if fit_id in self.fit_frames:
-            self.fit_frames[fit_id].pack(fill=tk.BOTH, expand=True)
+        self.fit_frames[fit_id].pack(fill=tk.BOTH, expand=True)
+        self._visible_fit_id = fit_id
 
     def _on_fit_func_changed_for_tab(self, fit_state: dict) -> None:
         """Update parameter labels when fit function changes for a specific tab."""
         fit_func = fit_state["fit_func_var"].get()
-        param_names_map = {
-            "gaus": ["Constant (p0)", "Mean (p1)", "Sigma (p2)"],
-            "landau": ["Constant (p0)", "Mean (p1)", "Width (p2)"],
-            "expo": ["Constant (p0)", "Slope (p1)"],
-            "pol1": ["a0 (p0)", "a1 (p1)"],
-            "pol2": ["a0 (p0)", "a1 (p1)", "a2 (p2)"],
-            "pol3": ["a0 (p0)", "a1 (p1)", "a2 (p2)", "a3 (p3)"],
-        }
+        # Re-selecting the current function leaves the rows as they are
+        if fit_func == fit_state["shown_fit_func"]:
+            return
+        fit_state["shown_fit_func"] = fit_func
+        expected_params = _PARAM_NAMES_MAP.get(fit_func, ())
+
+        if len(expected_params) != len(fit_state["param_entries"]):
+            # Start values of a different parameter set do not carry over
+            # (same count, e.g. gaus <-> landau, keeps them)
+            for _label, _entry, _checkbox, var, fixed_var in fit_state["_param_rows"]:
+                var.set("")
+                fixed_var.set(False)
+            fit_state["last_params"] = ("",) * len(expected_params)
+        self._layout_param_rows(fit_state, expected_params)
+
+        fit_state["params_frame"].configure(text=self._params_frame_title(fit_func))
+
+    @staticmethod
+    def _params_frame_title(fit_func: str) -> str:
+        """Title of the "Initial Parameters" frame for `fit_func`."""
+        return f"Initial Parameters ({_FIT_FUNC_TITLES.get(fit_func, fit_func)})"
+
+    def _layout_param_rows(self, fit_state: dict, names: tuple[str, ...]) -> None:
+        """Show one parameter row per name, reusing pooled rows.
+
+        Rows are created the first time a function needs them and are
+        only hidden with grid_forget() afterwards, so switching functions
+        relabels and re-grids widgets instead of destroying them.
+        """
+        rows = fit_state["_param_rows"]
+        params_inner = fit_state["params_inner"]
+        while len(rows) < len(names):
+            var = tk.StringVar(value="")
+            fixed_var = tk.BooleanVar(value=False)
+            entry = ttk.Entry(params_inner, textvariable=var, width=10)
+            self._bind_param_entry(entry, fit_state)
+            checkbox = ttk.Checkbutton(params_inner, text="Fix", variable=fixed_var)
+            rows.append((ttk.Label(params_inner), entry, checkbox, var, fixed_var))
+
+        for i, (label, entry, checkbox, _var, _fixed_var) in enumerate(rows):
+            if i < len(names):
+                label.configure(text=f"{names[i]}:")
+                label.grid(row=0, column=i*3, sticky="e", padx=(4, 2))
+                entry.grid(row=0, column=i*3+1, sticky="w", padx=(0, 4))
+                checkbox.grid(row=0, column=i*3+2, sticky="w", padx=(0, 12))
+            else:
+                label.grid_forget()
+                entry.grid_forget()
+                checkbox.grid_forget()
 
-        expected_params = param_names_map.get(fit_func, [])
-        current_param_count = len(fit_state["param_entries"])
+        shown = rows[:len(names)]
+        fit_state["param_entries"] = [row[3] for row in shown]
+        fit_state["param_fixed_vars"] = [row[4] for row in shown]
 
-        if len(expected_params) != current_param_count:
-            for widget in fit_state["params_frame"].winfo_children():
-                widget.destroy()
+    def _bind_param_entry(self, entry: ttk.Entry, fit_state: dict) -> None:
+        """Route key releases and focus loss of a parameter entry to the refit debounce."""
+        for sequence in ("<KeyRelease>", "<FocusOut>"):
+            entry.bind(sequence, lambda event, fs=fit_state: self._on_param_edited(fs))
 
-            fit_state["param_entries"] = []
-            fit_state["param_fixed_vars"] = []
+    def _on_param_edited(self, fit_state: dict) -> None:
+        """Schedule a refit only if some parameter text actually changed.
 
-            for i, name in enumerate(expected_params):
-                ttk.Label(fit_state["params_frame"], text=f"{name}:").grid(row=0, column=i*3, sticky="e", padx=(4, 2))
-                var = tk.StringVar(value="")
-                entry = ttk.Entry(fit_state["params_frame"], textvariable=var, width=10)
-                entry.grid(row=0, column=i*3+1, sticky="w", padx=(0, 4))
-                var.trace_add("write", lambda *args, fs=fit_state: self._schedule_refit_for_tab(fs))
+        Key releases that leave the text alone (arrows, Tab, modifiers) and
+        focus changes after an already scheduled edit are dropped here.
+        """
+        params = tuple(var.get().strip() for var in fit_state["param_entries"])
+        if params == fit_state["last_params"]:
+            return
+        fit_state["last_params"] = params
+        try:
+            self._cache_param_values(fit_state, params)
+        except ValueError:
+            pass  # Number still being typed; the fit reports it if it stays
+        self._schedule_refit_for_tab(fit_state)
+
+    @staticmethod
+    def _cache_param_values(fit_state: dict, texts: tuple[str, ...]) -> tuple[float, ...]:
+        """Parse the non-empty parameter texts once and cache them by text."""
+        values = tuple(float(text) for text in texts if text)
+        fit_state["_params_cache"] = (texts, values)
+        return values
 
-                fixed_var = tk.BooleanVar(value=False)
-                checkbox = ttk.Checkbutton(fit_state["params_frame"], text="Fix", variable=fixed_var)
-                checkbox.grid(row=0, column=i*3+2, sticky="w", padx=(0, 12))
+    def _schedule_refit_for_tab(self, fit_state: dict) -> None:
+        """Schedule a refit for a specific tab with debounce.
 
-                fit_state["param_entries"].append(var)
-                fit_state["param_fixed_vars"].append(fixed_var)
+        The delay scales with the number of parameter fields (150 ms plus
+        60 ms per field, capped at 450 ms). Until it fires the fit is in
+        fast-preview mode: any fit run meanwhile is quiet and draws nothing.
 
-            fit_state["params_frame"].configure(text=f"Initial Parameters ({fit_func})")
+        Edits arriving in the same event-loop pass (queued key releases
+        from fast typing or key autorepeat) share one scheduled refit
+        instead of cancelling and rescheduling it once per event.
+        """
+        fit_state["fast_preview"] = True
+        fit_state["write_epoch"] += 1
+        pending = fit_state["refit_pending"]
+        if pending["id"] is not None and fit_state["pending_epoch"] == fit_state["write_epoch"] - 1:
+            fit_state["pending_epoch"] = fit_state["write_epoch"]
+            return
 
-    def _schedule_refit_for_tab(self, fit_state: dict) -> None:
-        """Schedule a refit for a specific tab with debounce."""
-        if fit_state["refit_pending"]["id"] is not None:
-            self._app.after_cancel(fit_state["refit_pending"]["id"])
-        fit_state["refit_pending"]["id"] = self._app.after(500, lambda: self._perform_fit_for_tab(self._app, fit_state))
+        if pending["id"] is not None:
+            self._app.after_cancel(pending["id"])
+        delay = min(150 + 60 * len(fit_state["param_entries"]), 450)
+        pending["id"] = self._app.after(delay, lambda: self._run_scheduled_refit(fit_state))
+        fit_state["pending_epoch"] = fit_state["write_epoch"]
+        # The burst ends once Tk goes idle; later writes restart the debounce
+        self._app.after_idle(lambda: fit_state.__setitem__("pending_epoch", -1))
+
+    def _run_scheduled_refit(self, fit_state: dict) -> None:
+        """Debounce expired: leave fast-preview mode and run the full fit."""
+        fit_state["refit_pending"]["id"] = None
+        fit_state["fast_preview"] = False
+        self._perform_fit_for_tab(self._app, fit_state)
 
     def _on_fit_tab_changed(self) -> None:
         """Auto-fit when switching to a new fit that has valid range and no fit yet."""
         if self.current_fit_id is None:
             return
-        fit_state = self.fit_states.get(self.current_fit_id)
-        if not fit_state or fit_state.get("has_fit"):
+        try:
+            fit_state = self.fit_states[self.current_fit_id]
+        except KeyError:
+            return
+        if fit_state.get("has_fit"):
             return
         if self._has_valid_fit_range(fit_state):
             self._perform_fit_for_tab(self._app, fit_state)
@@ -471,8 +868,7 @@ class FittingFeature:
             width = float(fit_state["width_var"].get().strip())
             return energy > 0 and width > 0
         except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.INFO,
+            self._dispatcher.emit_info(
                 "Failed to validate fit range values",
                 context="FittingFeature._has_valid_fit_range",
                 exception=e
@@ -481,43 +877,64 @@ class FittingFeature:
 
     def _default_fit_params(self, fit_func: str, fit_state: dict, xmin: float, xmax: float) -> list[float]:
         """Build default fit parameters from the tab inputs and histogram stats."""
-        try:
-            energy = float(fit_state["energy_var"].get().strip())
-        except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.INFO,
-                "Failed to parse energy from fit state",
-                context="FittingFeature._default_fit_params",
-                exception=e
-            )
-            energy = None
+        energy_text = fit_state["energy_var"].get().strip()
+        width_text = fit_state["width_var"].get().strip()
 
-        try:
-            width = float(fit_state["width_var"].get().strip())
-        except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.INFO,
-                "Failed to parse width from fit state",
-                context="FittingFeature._default_fit_params",
-                exception=e
-            )
-            width = None
+        # Empty fields are the common case on refits; skip the exception path
+        energy = None
+        if energy_text:
+            try:
+                energy = float(energy_text)
+            except ValueError as e:
+                self._dispatcher.emit_info(
+                    "Failed to parse energy from fit state",
+                    context="FittingFeature._default_fit_params",
+                    exception=e
+                )
+
+        width = None
+        if width_text:
+            try:
+                width = float(width_text)
+            except ValueError as e:
+                self._dispatcher.emit_info(
+                    "Failed to parse width from fit state",
+                    context="FittingFeature._default_fit_params",
+                    exception=e
+                )
 
-        hist = self.current_hist_clone
-        hist_mean = float(hist.GetMean()) if hist and hasattr(hist, "GetMean") else (xmin + xmax) / 2
+        hist = self._get_clone()
+        # Histogram contents do not change between refits, so ROOT lookups
+        # are cached per clone (cleared in on_selection)
+        stats = self._hist_stats_cache.setdefault(id(hist), {})
+        has_hist = bool(hist) and hasattr(hist, "FindBin")
+
+        if has_hist:
+            try:
+                hist_mean = stats["mean"]
+            except KeyError:
+                hist_mean = stats["mean"] = float(hist.GetMean())
+        else:
+            hist_mean = (xmin + xmax) / 2
         peak_x = energy if energy is not None else hist_mean
 
+        peak_key = ("peak_height", round(peak_x, 6))
         try:
-            peak_bin = hist.FindBin(peak_x) if hist and hasattr(hist, "FindBin") else None
-            peak_height = float(hist.GetBinContent(peak_bin)) if peak_bin is not None else 1.0
-        except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.INFO,
-                "Failed to calculate peak height from histogram",
-                context="FittingFeature._default_fit_params",
-                exception=e
-            )
-            peak_height = 1.0
+            peak_height = stats[peak_key]
+        except KeyError:
+            try:
+                if has_hist:
+                    peak_height = float(hist.GetBinContent(self._find_bin(hist, stats, peak_x)))
+                else:
+                    peak_height = 1.0
+                stats[peak_key] = peak_height
+            except Exception as e:
+                self._dispatcher.emit_info(
+                    "Failed to calculate peak height from histogram",
+                    context="FittingFeature._default_fit_params",
+                    exception=e
+                )
+                peak_height = 1.0
 
         if width is None or width <= 0:
             width = max((xmax - xmin) / 5, 1.0)
@@ -530,299 +947,452 @@ class FittingFeature:
             return [peak_height, peak_x, width]
         if fit_func == "expo":
             return [0.0, -0.001]
-        if fit_func == "pol1":
-            return [peak_height, 0.0]
-        if fit_func == "pol2":
-            return [peak_height, 0.0, 0.0]
-        if fit_func == "pol3":
-            return [peak_height, 0.0, 0.0, 0.0]
+        if fit_func in _POLY_ORDERS:
+            # Warm-start Minuit from a least-squares fit to the bin contents
+            if has_hist:
+                seed = self._poly_seed(hist, stats, _POLY_ORDERS[fit_func], xmin, xmax)
+                if seed is not None:
+                    return list(seed)
+            return [peak_height] + [0.0] * _POLY_ORDERS[fit_func]
         return []
 
-    def _perform_fit_for_tab(self, app, fit_state: dict) -> None:
-        """Perform fit for a specific tab."""
-        # Ensure we have a histogram (original or clone)
-        if self.current_hist is None:
-            messagebox.showwarning("No histogram", "Please select a histogram first")
-            return
-        
-        # Create clone if it doesn't exist
-        if self.current_hist_clone is None:
+    def _poly_seed(self, hist, stats: dict, order: int, xmin: float, xmax: float) -> tuple[float, ...] | None:
+        """Least-squares polynomial start values from the bins in [xmin, xmax].
+
+        Cached in stats per (order, bin range); None if the bins do not
+        determine the polynomial.
+        """
+        nbins = hist.GetNbinsX()
+        lo = max(self._find_bin(hist, stats, xmin), 1)
+        hi = min(self._find_bin(hist, stats, xmax), nbins)
+        key = ("poly_seed", order, lo, hi)
+        try:
+            return stats[key]
+        except KeyError:
+            pass
+
+        try:
+            bins = range(lo, hi + 1)
+            xs = [hist.GetBinCenter(i) for i in bins]
+            ys = [hist.GetBinContent(i) for i in bins]
+            coeffs = _poly_least_squares(xs, ys, order)
+        except Exception as e:
+            self._dispatcher.emit_info(
+                "Failed to estimate polynomial start values",
+                context="FittingFeature._poly_seed",
+                exception=e
+            )
+            coeffs = None
+        seed = tuple(coeffs) if coeffs is not None else None
+        stats[key] = seed
+        return seed
+
+    @staticmethod
+    def _find_bin(hist, stats: dict, x: float) -> int:
+        """Return the bin index of x, matching TH1::FindBin.
+
+        For uniformly binned axes the index is computed from the axis
+        geometry cached in stats, avoiding a ROOT call per refit.
+        """
+        try:
+            axis = stats["axis"]
+        except KeyError:
+            xaxis = hist.GetXaxis()
+            if xaxis.GetXbins().GetSize() == 0:
+                axis = (xaxis.GetXmin(), xaxis.GetXmax(), xaxis.GetBinWidth(1), xaxis.GetNbins())
+            else:
+                axis = None  # Variable bin widths: defer to ROOT
+            stats["axis"] = axis
+
+        if axis is None:
+            return hist.FindBin(x)
+
+        axis_min, axis_max, bin_width, nbins = axis
+        if x < axis_min:
+            return 0
+        if x >= axis_max:
+            return nbins + 1
+        return min(int((x - axis_min) / bin_width) + 1, nbins)
+
+    def _get_clone(self):
+        """Return the fitting clone of the current histogram, cloning on first use.
+
+        on_selection drops the clone, so browsing histograms without
+        fitting never pays for TH1::Clone. Falls back to the original
+        histogram if cloning fails.
+        """
+        if self.current_hist_clone is None and self.current_hist is not None:
             try:
                 clone_name = f"{self.current_hist.GetName()}_fit_clone" if hasattr(self.current_hist, "GetName") else "hist_fit_clone"
                 self.current_hist_clone = self.current_hist.Clone(clone_name)
             except Exception as e:
-                self._dispatcher.emit(
-                    ErrorLevel.INFO,
+                self._dispatcher.emit_info(
                     "Failed to clone histogram for fit performance, using original",
-                    context="FittingFeature._perform_fit_for_tab",
+                    context="FittingFeature._get_clone",
                     exception=e
                 )
                 self.current_hist_clone = self.current_hist
+        return self.current_hist_clone
 
+    def _perform_fit_for_tab(self, app, fit_state: dict) -> None:
+        """Perform fit for a specific tab.
+
+        Only the inputs are collected here. The ROOT fit
+        (`_run_fit_for_tab`) and the display update (`_finish_fit_for_tab`)
+        run as separate idle callbacks, so Tk draws the running-fit marker
+        and handles pending input between the stages.
+        """
+        # Ensure we have a histogram (original or clone)
+        if self.current_hist is None:
+            messagebox.showwarning("No histogram", "Please select a histogram first")
+            return
+        
         if fit_state is None:
             messagebox.showwarning("Error", "Invalid fit state")
             return
 
+        hist = self._get_clone()
+
         try:
             root = self._get_root_module(app)
             if root is None:
                 return
 
-            # Always restart fit state from scratch
-            fit_state["cached_results"] = None
-            fit_state["has_fit"] = False
-            fit_state["fit_result"] = None
-            fit_state["fit_func_obj"] = None
-            fit_state["fit_epoch"] += 1
+            fit_func = fit_state["fit_func_var"].get()
+            fit_range = self._get_fit_range_for_tab(fit_state)
+
+            # Filled start values, parsed by the edit handler unless the
+            # texts changed without a key event (e.g. mouse paste)
+            texts = tuple(var.get().strip() for var in fit_state["param_entries"])
+            cached_texts, params = fit_state["_params_cache"]
+            if texts != cached_texts:
+                params = self._cache_param_values(fit_state, texts)
+            fixed_params = tuple(fixed_var.get() for fixed_var in fit_state["param_fixed_vars"])
+
+            # Default: S=return TFitResult, Q=quiet. S is always forced on,
+            # and so is N: every fit shares one clone, and N keeps Fit()
+            # from storing its function there (the fit's own TF1 holds the
+            # result), so sibling fits never see each other's functions
+            options_text = fit_state["fit_options_var"].get().strip() or "SQ"
+            fit_option = _set_fit_option_letters(options_text, "SN")
+            if fit_state["fast_preview"]:
+                # Edits still settling: quiet fit that draws nothing
+                fit_option = _set_fit_option_letters(fit_option, "Q0")
+
+            xaxis = hist.GetXaxis() if hasattr(hist, "GetXaxis") else None
+            default_xmin = xaxis.GetXmin() if xaxis else 0
+            default_xmax = xaxis.GetXmax() if xaxis else 10000
+            xmin = fit_range[0] if fit_range[0] is not None else default_xmin
+            xmax = fit_range[1] if fit_range[1] is not None else default_xmax
+
+            # Skip the fit when nothing that feeds it changed since the
+            # last successful one (energy/width also drive the defaults)
+            fit_key = (
+                fit_func, xmin, xmax, params, fixed_params, fit_option, options_text,
+                fit_state["energy_var"].get(), fit_state["width_var"].get(),
+                self._clone_epoch,
+            )
+            if fit_key == fit_state["last_fit_key"] and fit_state["has_fit"]:
+                return
+        except Exception as e:
+            self._fit_failed(fit_state, e)
+            return
+
+        # A newer request supersedes stages that have not run yet
+        fit_state["fit_token"] += 1
+        token = fit_state["fit_token"]
+        self._set_fit_running(fit_state, True)
+        self._app.after_idle(lambda: self._run_fit_for_tab(fit_state, token, fit_key))
+
+    def _run_fit_for_tab(self, fit_state: dict, token: int, fit_key: tuple) -> None:
+        """Second fit stage: run TH1::Fit on the inputs in `fit_key` and cache the results."""
+        if token != fit_state["fit_token"]:
+            return
+        if fit_key[-1] != self._clone_epoch:
+            # Another histogram was selected in between: start over for it
+            self._perform_fit_for_tab(self._app, fit_state)
+            return
+        fit_func, xmin, xmax, params, fixed_params, fit_option, options_text = fit_key[:7]
+        hist = self._get_clone()
 
-            prev_batch = root.gROOT.IsBatch()
-            root.gROOT.SetBatch(True)
+        try:
+            g_root = self._gROOT
+            prev_batch = g_root.IsBatch()
+            if not prev_batch:
+                g_root.SetBatch(True)
 
             try:
-                fit_func = fit_state["fit_func_var"].get()
-                fit_range = self._get_fit_range_for_tab(fit_state)
-
-                params = [float(v.get()) if v.get().strip() else None for v in fit_state["param_entries"]]
-                params = [p for p in params if p is not None]
-
-                fixed_params = [fixed_var.get() for fixed_var in fit_state["param_fixed_vars"]]
-
-                fit_option = fit_state["fit_options_var"].get().strip()
-                if not fit_option:
-                    fit_option = "SQ"  # Default: S=return TFitResult, Q=quiet
-                
-                if "S" not in fit_option:
-                    fit_option += "S"
-
-                with open(os.devnull, "w") as devnull:
-                    with redirect_stdout(devnull), redirect_stderr(devnull):
-                        # Remove only this tab's previous fit function (do not clear others)
-                        fit_list = self.current_hist_clone.GetListOfFunctions()
-                        prev_func = fit_state.get("fit_func_obj")
-                        if fit_list and prev_func:
-                            try:
-                                fit_list.Remove(prev_func)
-                            except Exception as e:
-                                self._dispatcher.emit(
-                                    ErrorLevel.INFO,
-                                    "Failed to remove previous fit function from histogram",
-                                    context="FittingFeature._perform_fit_for_tab",
-                                    exception=e
-                                )
-                            try:
-                                root.gROOT.RecursiveRemove(prev_func)
-                            except Exception as e:
-                                self._dispatcher.emit(
-                                    ErrorLevel.INFO,
-                                    "Failed to recursively remove previous fit function",
-                                    context="FittingFeature._perform_fit_for_tab",
-                                    exception=e
-                                )
-
-                        xaxis = self.current_hist_clone.GetXaxis() if hasattr(self.current_hist_clone, "GetXaxis") else None
-                        default_xmin = xaxis.GetXmin() if xaxis else 0
-                        default_xmax = xaxis.GetXmax() if xaxis else 10000
-                        xmin = fit_range[0] if fit_range[0] is not None else default_xmin
-                        xmax = fit_range[1] if fit_range[1] is not None else default_xmax
-
-                        fit_name = f"fit_{fit_func}_{fit_state['fit_id']}_{fit_state['fit_epoch']}"
-                        fit_obj = root.TF1(fit_name, fit_func, xmin, xmax)
-
-                        if not params:
-                            params = self._default_fit_params(fit_func, fit_state, xmin, xmax)
-
-                        if params:
+                # Restart fit state from scratch
+                fit_state["cached_results"] = None
+                fit_state["has_fit"] = False
+                fit_state["fit_result"] = None
+                fit_state["fit_func_obj"] = None
+                fit_state["last_fit_key"] = None
+
+                with redirect_stdout(_DEVNULL), redirect_stderr(_DEVNULL):
+                    fit_obj = self._get_fit_function(fit_state, fit_func, xmin, xmax)
+
+                    if not params:
+                        params = self._default_fit_params(fit_func, fit_state, xmin, xmax)
+
+                    if params:
+                        for i, p in enumerate(params):
+                            fit_obj.SetParameter(i, p)
+
+                        for i, is_fixed in enumerate(fixed_params):
+                            if is_fixed and i < len(params):
+                                fit_obj.FixParameter(i, params[i])
+
+                    fit_state["fit_result"] = hist.Fit(fit_obj, fit_option, "", xmin, xmax)
+                    fit_state["fit_func_obj"] = fit_obj
+
+                    # Retry once on the same TF1 with nudged start values if
+                    # the TFitResultPtr is empty despite the S option
+                    try:
+                        if hasattr(fit_state["fit_result"], "Get") and fit_state["fit_result"].Get() is None:
                             for i, p in enumerate(params):
-                                fit_obj.SetParameter(i, p)
-
-                            for i, is_fixed in enumerate(fixed_params):
-                                if is_fixed and i < len(params):
-                                    fit_obj.FixParameter(i, params[i])
-
-                        fit_state["fit_result"] = self.current_hist_clone.Fit(fit_obj, fit_option, "", xmin, xmax)
-                        fit_state["fit_func_obj"] = fit_obj
-
-                        # Retry once if TFitResultPtr is empty despite S option
-                        try:
-                            if hasattr(fit_state["fit_result"], "Get") and fit_state["fit_result"].Get() is None:
-                                retry_option = fit_option
-                                if "S" not in retry_option:
-                                    retry_option += "S"
-                                fit_state["fit_epoch"] += 1
-                                retry_name = f"fit_{fit_func}_{fit_state['fit_id']}_{fit_state['fit_epoch']}"
-                                retry_obj = root.TF1(retry_name, fit_func, xmin, xmax)
-                                if not params:
-                                    params = self._default_fit_params(fit_func, fit_state, xmin, xmax)
-
-                                if params:
-                                    for i, p in enumerate(params):
-                                        retry_obj.SetParameter(i, p)
-                                    for i, is_fixed in enumerate(fixed_params):
-                                        if is_fixed and i < len(params):
-                                            retry_obj.FixParameter(i, params[i])
-                                fit_state["fit_result"] = self.current_hist_clone.Fit(retry_obj, retry_option, "", xmin, xmax)
-                                fit_state["fit_func_obj"] = retry_obj
-                        except Exception as e:
-                            self._dispatcher.emit(
-                                ErrorLevel.INFO,
-                                "Failed to retry fit after initial failure",
-                                context="FittingFeature._perform_fit_for_tab",
-                                exception=e
-                            )
+                                if not (i < len(fixed_params) and fixed_params[i]):
+                                    fit_obj.SetParameter(i, p * 1.01)
+                            fit_state["fit_result"] = hist.Fit(fit_obj, fit_option, "", xmin, xmax)
+                    except Exception as e:
+                        self._dispatcher.emit_info(
+                            "Failed to retry fit after initial failure",
+                            context="FittingFeature._run_fit_for_tab",
+                            exception=e
+                        )
 
                 # Cache fit results immediately before they become invalid (this persists)
-                self._cache_fit_results(fit_state)
+                # Results show the options as typed, not the forced S/N/Q/0
+                self._cache_fit_results(fit_state, fit_func, options_text)
 
                 # Mark fit as successful only when cached results are valid
                 cached = fit_state.get("cached_results")
-                if cached and "error" not in cached:
+                if cached is not None and cached.error is None:
                     fit_state["has_fit"] = True
+                    fit_state["last_fit_key"] = fit_key
 
                 # Clear fit_result after caching since ROOT object will become invalid
                 fit_state["fit_result"] = None
-
-                self._render_fit_preview_for_tab(root, fit_state)
-                self._display_fit_results_for_tab(fit_state)
             finally:
-                root.gROOT.SetBatch(prev_batch)
+                if not prev_batch:
+                    g_root.SetBatch(False)
 
         except Exception as e:
-            import traceback
-            error_msg = f"Fit failed: {e}\n{traceback.format_exc()}"
-            self._show_results_for_tab(fit_state, error_msg)
+            self._fit_failed(fit_state, e)
+            return
+
+        self._app.after_idle(lambda: self._finish_fit_for_tab(fit_state, token))
+
+    def _finish_fit_for_tab(self, fit_state: dict, token: int) -> None:
+        """Last fit stage: show the cached results of the fit."""
+        if token != fit_state["fit_token"]:
+            return
+        self._set_fit_running(fit_state, False)
+        try:
+            self._render_fit_preview_for_tab(self._root, fit_state)
+            self._display_fit_results_for_tab(fit_state)
+        except Exception as e:
+            self._fit_failed(fit_state, e)
+
+    def _fit_failed(self, fit_state: dict, e: Exception) -> None:
+        """Drop the fit's results and report why it failed."""
+        fit_state["cached_results"] = None
+        fit_state["has_fit"] = False
+        fit_state["last_fit_key"] = None
+        fit_state["_last_displayed"] = None
+        self._set_fit_running(fit_state, False)
+        # Routine failures (e.g. half-typed start values) log one line; the
+        # traceback is only attached when DEBUG logging is on
+        self._dispatcher.emit_warning(
+            f"Fit failed: {e}",
+            context="FittingFeature._perform_fit_for_tab",
+            exception=e if self._dispatcher.debug_enabled() else None
+        )
+        self._show_results_for_tab(fit_state, f"Fit failed: {e}")
 
-    def _cache_fit_results(self, fit_state: dict) -> None:
-        """Extract and cache fit results before they become invalid."""
+    @staticmethod
+    def _set_fit_running(fit_state: dict, running: bool) -> None:
+        """Mark the results heading while a fit is pending."""
+        label = fit_state["results_label"]
+        if label is not None:
+            label.configure(text="Results (fitting...)" if running else "Results")
+
+    def _get_fit_function(self, fit_state: dict, fit_func: str, xmin: float, xmax: float):
+        """Return this fit's TF1 for `fit_func`, reset for a new fit.
+
+        The TF1 is created once per (fit, function) and kept in
+        `fit_state["tf1_cache"]`; later refits only update its range and
+        release any parameters fixed by the previous fit.
+        """
+        tf1_cache = fit_state["tf1_cache"]
+        try:
+            fit_obj = tf1_cache[fit_func]
+        except KeyError:
+            fit_obj = self._TF1(f"fit_{fit_func}_{fit_state['fit_id']}", fit_func, xmin, xmax)
+            tf1_cache[fit_func] = fit_obj
+            return fit_obj
+
+        fit_obj.SetRange(xmin, xmax)
+        for i in range(fit_obj.GetNpar()):
+            fit_obj.ReleaseParameter(i)
+        return fit_obj
+
+    def _cache_fit_results(self, fit_state: dict, fit_func: str, fit_options: str) -> None:
+        """Extract and cache the results of fitting `fit_func` before they become invalid.
+
+        The fitted TF1 is read directly whenever it carries a fit (NDF > 0);
+        the TFitResultPtr is only resolved as a fallback.
+        """
         if fit_state["fit_result"] is None:
-            fit_state["cached_results"] = {"error": "Fit result is None"}
+            fit_state["cached_results"] = _FIT_RESULT_NONE_ERROR
+            return
+
+        func_obj = fit_state.get("fit_func_obj")
+        try:
+            has_fitted_func = func_obj is not None and int(func_obj.GetNDF()) > 0
+        except Exception:
+            has_fitted_func = False
+        if has_fitted_func and self._cache_fit_results_fast(fit_state, func_obj, fit_func, fit_options):
             return
+        self._cache_fit_results_slow(fit_state, fit_state["fit_result"], fit_func, fit_options)
 
-        def _normalize_result(result):
-            if hasattr(result, "Get"):
+    def _cache_fit_results_fast(self, fit_state: dict, func_obj, fit_func: str, fit_options: str) -> bool:
+        """Cache results from the fitted TF1; return False if that fails."""
+        if func_obj is None:
+            return False
+        try:
+            # TF1 interface is fixed; a missing method lands in the except below
+            npar = int(func_obj.GetNpar())
+            params, errors = _read_tf1_arrays(func_obj, npar) if npar > 0 else ([], [])
+            chi2 = float(func_obj.GetChisquare())
+            ndf = int(func_obj.GetNDF())
+            fit_state["cached_results"] = CachedFitResult.from_fit(
+                fit_func,
+                chi2=chi2,
+                ndf=ndf,
+                status=0,
+                parameters=tuple(params),
+                errors=tuple(errors),
+                fit_options=fit_options,
+            )
+            return True
+        except Exception as e:
+            self._dispatcher.emit_info(
+                "Failed to cache results from TF1 function object",
+                context="FittingFeature._cache_fit_results_fast",
+                exception=e
+            )
+            return False
+
+    def _cache_fit_results_slow(self, fit_state: dict, result_ptr, fit_func: str, fit_options: str) -> None:
+        """Cache results by resolving the TFitResultPtr returned by Fit."""
+        try:
+            result = result_ptr
+            if hasattr(result_ptr, "Get"):
                 try:
-                    resolved = result.Get()
+                    resolved = result_ptr.Get()
                     if resolved:
-                        return resolved
+                        result = resolved
                 except Exception as e:
-                    self._dispatcher.emit(
-                        ErrorLevel.INFO,
+                    self._dispatcher.emit_info(
                         "Failed to resolve TFitResultPtr",
-                        context="FittingFeature._cache_fit_results._normalize_result",
+                        context="FittingFeature._cache_fit_results_slow",
                         exception=e
                     )
-            return result
 
-        def _cache_from_func(func_obj) -> bool:
-            if func_obj is None:
-                return False
-            try:
-                npar = int(func_obj.GetNpar()) if hasattr(func_obj, "GetNpar") else 0
-                params = [float(func_obj.GetParameter(i)) for i in range(npar)] if npar > 0 else []
-                errors = [float(func_obj.GetParError(i)) for i in range(npar)] if npar > 0 else []
-                chi2 = float(func_obj.GetChisquare()) if hasattr(func_obj, "GetChisquare") else 0.0
-                ndf = int(func_obj.GetNDF()) if hasattr(func_obj, "GetNDF") else 0
-                fit_state["cached_results"] = {
-                    "chi2": chi2,
-                    "ndf": ndf,
-                    "status": 0,
-                    "parameters": params,
-                    "errors": errors,
-                }
-                return True
-            except Exception as e:
-                self._dispatcher.emit(
-                    ErrorLevel.INFO,
-                    "Failed to cache results from TF1 function object",
-                    context="FittingFeature._cache_fit_results._cache_from_func",
-                    exception=e
-                )
-                return False
-
-        try:
-            if _cache_from_func(fit_state.get("fit_func_obj")):
-                return
-
-            result = _normalize_result(fit_state["fit_result"])
-
-            # Try to get status - if this fails, try TF1 fallback
-            try:
-                status = int(result.Status())
-            except Exception as e:
-                if isinstance(result, (int, float)):
+            # A TFitResult has Status(); a bare int result is itself the status
+            status_fn = getattr(result, "Status", None)
+            status_error = None
+            if callable(status_fn):
+                try:
+                    status = int(status_fn())
+                except Exception as e:
+                    status_error = e
+            else:
+                try:
                     status = int(result)
-                    fit_state["cached_results"] = {
-                        "error": f"Fit failed with status {status}. Try adjusting energy range or initial parameters.",
-                    }
+                except (TypeError, ValueError) as e:
+                    status_error = e
+                else:
+                    fit_state["cached_results"] = CachedFitResult(
+                        error=f"Fit failed with status {status}. Try adjusting energy range or initial parameters.",
+                    )
                     return
-                if _cache_from_func(fit_state.get("fit_func_obj")):
+
+            if status_error is not None:
+                if self._cache_fit_results_fast(fit_state, fit_state.get("fit_func_obj"), fit_func, fit_options):
                     return
-                self._dispatcher.emit(
-                    ErrorLevel.INFO,
+                self._dispatcher.emit_info(
                     "Failed to get fit status from result object",
-                    context="FittingFeature._cache_fit_results",
-                    exception=e
+                    context="FittingFeature._cache_fit_results_slow",
+                    exception=status_error
                 )
-                fit_state["cached_results"] = {"error": f"Fit result invalid: {str(e)}"}
+                fit_state["cached_results"] = CachedFitResult(error=f"Fit result invalid: {str(status_error)}")
                 return
 
             # Status 0 means successful fit, other values indicate failure
             if status != 0:
-                fit_state["cached_results"] = {
-                    "error": f"Fit failed with status {status}. Try adjusting energy range or initial parameters.",
-                }
+                fit_state["cached_results"] = CachedFitResult(
+                    error=f"Fit failed with status {status}. Try adjusting energy range or initial parameters.",
+                )
                 return
 
-            # Cache all results as native Python types
+            # Cache all results as native Python types; Parameters() and
+            # Errors() return std::vector<double>, copied in one call each
             try:
-                num_params = len(result.Parameters()) if hasattr(result, "Parameters") else 0
+                parameters = tuple(result.Parameters()) if hasattr(result, "Parameters") else ()
+                errors = tuple(result.Errors()) if parameters else ()
             except Exception as e:
-                self._dispatcher.emit(
-                    ErrorLevel.INFO,
-                    "Failed to get parameter count from fit result",
-                    context="FittingFeature._cache_fit_results",
+                self._dispatcher.emit_info(
+                    "Failed to get parameters from fit result",
+                    context="FittingFeature._cache_fit_results_slow",
                     exception=e
                 )
-                num_params = 0
-
-            fit_state["cached_results"] = {
-                "chi2": float(result.Chi2()),
-                "ndf": int(result.Ndf()),
-                "status": status,
-                "parameters": list(result.Parameters()) if num_params > 0 else [],
-                "errors": [float(result.ParError(i)) for i in range(num_params)] if num_params > 0 else [],
-            }
+                parameters, errors = (), ()
+
+            fit_state["cached_results"] = CachedFitResult.from_fit(
+                fit_func,
+                chi2=float(result.Chi2()),
+                ndf=int(result.Ndf()),
+                status=status,
+                parameters=parameters,
+                errors=errors,
+                fit_options=fit_options,
+            )
         except Exception as e:
-            if _cache_from_func(fit_state.get("fit_func_obj")):
+            if self._cache_fit_results_fast(fit_state, fit_state.get("fit_func_obj"), fit_func, fit_options):
                 return
-            self._dispatcher.emit(
-                ErrorLevel.WARNING,
+            self._dispatcher.emit_warning(
                 "Failed to cache fit results",
-                context="FittingFeature._cache_fit_results",
+                context="FittingFeature._cache_fit_results_slow",
                 exception=e
             )
-            fit_state["cached_results"] = {
-                "error": f"Failed to cache results: {str(e)}",
-            }
+            fit_state["cached_results"] = CachedFitResult(error=f"Failed to cache results: {str(e)}")
 
     def _get_fit_range_for_tab(self, fit_state: dict) -> tuple[float | None, float | None]:
-        """Get fit range for a specific tab."""
-        try:
-            energy_str = fit_state["energy_var"].get().strip()
-            width_str = fit_state["width_var"].get().strip()
+        """Get fit range for a specific tab.
 
+        The parsed range is memoized in fit_state["_range_cache"], keyed by
+        the energy and width texts it was parsed from.
+        """
+        energy_str = fit_state["energy_var"].get().strip()
+        width_str = fit_state["width_var"].get().strip()
+        cached = fit_state["_range_cache"]
+        if cached is not None and cached[0] == energy_str and cached[1] == width_str:
+            return cached[2]
+        try:
             if not energy_str or not width_str:
+                fit_state["_range_cache"] = (energy_str, width_str, (None, None))
                 return (None, None)
 
             energy = float(energy_str)
-            width = float(width_str)
-
-            xmin = energy - width / 2
-            xmax = energy + width / 2
+            width_half = float(width_str) * 0.5
 
-            return (xmin, xmax)
+            fit_range = (energy - width_half, energy + width_half)
+            fit_state["_range_cache"] = (energy_str, width_str, fit_range)
+            return fit_range
         except ValueError as e:
-            self._dispatcher.emit(
-                ErrorLevel.INFO,
+            self._dispatcher.emit_info(
                 "Invalid fit range values provided",
                 context="FittingFeature._get_fit_range_for_tab",
                 exception=e
@@ -837,123 +1407,127 @@ class FittingFeature:
         tab's HistogramRenderer. The feature simply ensures the left pane has a
         placeholder so the UI remains consistent.
         """
-        if self.current_hist_clone is None:
+        if self.current_hist_clone is None or fit_state["left_frame"] is None:
             return
 
         try:
-            for widget in fit_state["left_frame"].winfo_children():
-                widget.destroy()
-
-            fit_state["image_label"] = ttk.Label(
-                fit_state["left_frame"], text="Preview available in tab", foreground="gray"
-            )
-            fit_state["image_label"].pack(fill=tk.BOTH, expand=True)
+            # Reuse the placeholder label created with the fit UI
+            label = fit_state["image_label"]
+            if label is None or not label.winfo_exists():
+                label = ttk.Label(fit_state["left_frame"])
+                label.pack(fill=tk.BOTH, expand=True)
+                fit_state["image_label"] = label
+            label.configure(text="Preview available in tab", foreground="gray")
         except Exception as e:
             self._show_results_for_tab(fit_state, f"Render preview error: {e}")
 
     def _display_fit_results_for_tab(self, fit_state: dict) -> None:
         """Display fit results for a specific tab."""
-        if fit_state.get("cached_results") is None:
+        cached = fit_state.get("cached_results")
+        if cached is None:
             return
-
-        cached = fit_state["cached_results"]
+        # cached_results is immutable and carries the fitted function and
+        # options the text is built from, so identity means nothing changed
+        if cached is fit_state["_last_displayed"]:
+            return
+        if fit_state["fit_result_text"]:
+            fit_state["_last_displayed"] = cached
 
         # Check if there was an error
-        if "error" in cached:
-            self._show_results_for_tab(fit_state, cached["error"])
+        if cached.error is not None:
+            self._show_results_for_tab(fit_state, cached.error)
             return
 
-        chi2 = cached["chi2"]
-        ndf = cached["ndf"]
-        status = cached["status"]
-        parameters = cached["parameters"]
-        errors = cached["errors"]
-
-        result_lines = [
-            f"Fit Function: {fit_state['fit_func_var'].get()}",
-            f"Fit Options: {fit_state['fit_options_var'].get()}",
-            f"Chi-square: {chi2:.6f}",
-            f"NDF: {ndf}",
-            f"Reduced Chi-square: {chi2 / ndf if ndf > 0 else 'N/A'}",
-            f"Status: {status}",
+        # Label the results with what was fitted, not the current selection
+        fit_func = cached.fit_func or ""
+        reduced_chi2 = cached.reduced_chi2
+        header = (
+            f"Fit Function: {fit_func}",
+            f"Fit Options: {cached.fit_options or ''}",
+            f"Chi-square: {cached.chi2:.6f}",
+            f"NDF: {cached.ndf}",
+            f"Reduced Chi-square: {reduced_chi2 if reduced_chi2 is not None else 'N/A'}",
+            f"Status: {cached.status}",
             "",
             "Parameters:",
-        ]
+        )
 
         try:
-            param_names_display = {
-                "gaus": ["Constant", "Mean", "Sigma"],
-                "landau": ["Constant", "Mean", "Width"],
-                "expo": ["Constant", "Slope"],
-                "pol1": ["a0", "a1"],
-                "pol2": ["a0", "a1", "a2"],
-                "pol3": ["a0", "a1", "a2", "a3"],
-            }
-            names = param_names_display.get(fit_state['fit_func_var'].get(), [])
-
-            for i, param in enumerate(parameters):
-                error = errors[i] if i < len(errors) else 0
-                name = names[i] if i < len(names) else f"p[{i}]"
-                result_lines.append(f"  {name} = {param:.6f} ± {error:.6f}")
-
-            if fit_state['fit_func_var'].get() == "gaus" and len(parameters) >= 3:
-                mean = parameters[1]
-                sigma = parameters[2]
-                fwhm = 2.355 * sigma
-
-                constant = parameters[0]
-                area = constant * sigma * (2.506628)
-
-                result_lines.extend([
-                    "",
-                    "Peak Annotations:",
-                    f"  FWHM: {fwhm:.3f} keV",
-                    f"  Centroid: {mean:.3f} keV",
-                    f"  Area: {area:.1f}",
-                ])
-
-            elif fit_state['fit_func_var'].get() == "landau" and len(parameters) >= 3:
-                mean = parameters[1]
-                width = parameters[2]
-
-                result_lines.extend([
-                    "",
-                    "Peak Annotations:",
-                    f"  Most Probable Value: {mean:.3f} keV",
-                    f"  Width: {width:.3f} keV",
-                ])
-
+            text = "\n".join(chain(header, self._iter_parameter_lines(fit_func, cached)))
         except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.INFO,
+            self._dispatcher.emit_info(
                 "Failed to format fit result parameters for display",
                 context="FittingFeature._display_fit_results_for_tab",
                 exception=e
             )
-
-        self._show_results_for_tab(fit_state, "\n".join(result_lines))
+            text = "\n".join(header)
+
+        self._show_results_for_tab(fit_state, text)
+
+    @staticmethod
+    def _iter_parameter_lines(fit_func: str, cached: CachedFitResult):
+        """Yield the parameter and peak annotation lines of the results text."""
+        parameters = cached.parameters
+        names = _PARAM_DISPLAY_NAMES.get(fit_func, _FALLBACK_PARAM_NAMES)
+        if len(names) < len(parameters):
+            names = names + _FALLBACK_PARAM_NAMES[len(names):]
+            if len(names) < len(parameters):
+                names = names + tuple(f"p[{i}]" for i in range(len(names), len(parameters)))
+
+        # Missing errors read as 0; unnamed parameters as p[i]
+        for name, param, error in zip(names, parameters, chain(cached.errors, repeat(0.0))):
+            yield f"  {name} = {param:.6f} ± {error:.6f}"
+
+        if cached.fwhm is not None:
+            yield ""
+            yield "Peak Annotations:"
+            yield f"  FWHM: {cached.fwhm:.3f} keV"
+            yield f"  Centroid: {parameters[1]:.3f} keV"
+            yield f"  Area: {cached.area:.1f}"
+        elif fit_func == "landau" and len(parameters) >= 3:
+            yield ""
+            yield "Peak Annotations:"
+            yield f"  Most Probable Value: {parameters[1]:.3f} keV"
+            yield f"  Width: {parameters[2]:.3f} keV"
 
     def _show_results_for_tab(self, fit_state: dict, text: str) -> None:
-        """Show results in a specific tab."""
-        if not fit_state["fit_result_text"]:
+        """Show results in a specific tab.
+
+        After the first write only the lines that differ from the shown
+        text are replaced, so a refit that changes a few numbers does not
+        redraw the whole widget.
+        """
+        text_widget = fit_state["fit_result_text"]
+        last_text = fit_state["_last_text"]
+        if not text_widget or text == last_text:
             return
-        fit_state["fit_result_text"].config(state=tk.NORMAL)
-        fit_state["fit_result_text"].delete("1.0", tk.END)
-        fit_state["fit_result_text"].insert(tk.END, text)
-        fit_state["fit_result_text"].config(state=tk.DISABLED)
+        fit_state["_last_text"] = text
+        text_widget.config(state=tk.NORMAL)
+        if last_text is None:
+            text_widget.replace("1.0", tk.END, text)
+        else:
+            for start, end, chunk in _text_line_edits(last_text, text):
+                text_widget.replace(start, end, chunk)
+        text_widget.config(state=tk.DISABLED)
 
     def _get_root_module(self, app):
-        """Get ROOT module from app or import it directly."""
-        if app:
-            root = getattr(app, "ROOT", None)
-            if root is not None:
-                return root
+        """Get ROOT module from app or import it directly.
+
+        The module is memoized together with its TF1 and gROOT attributes,
+        which the refit path uses directly.
+        """
+        if self._root is not None:
+            return self._root
+        root = getattr(app, "ROOT", None) if app else None
         try:
-            import ROOT
-            return ROOT
+            if root is None:
+                import ROOT as root
+            self._TF1 = root.TF1
+            self._gROOT = root.gROOT
+            self._root = root
+            return root
         except Exception as e:
-            self._dispatcher.emit(
-                ErrorLevel.WARNING,
+            self._dispatcher.emit_warning(
                 "Failed to import ROOT module",
                 context="FittingFeature._get_root_module",
                 exception=e
@@ -5,13 +5,18 @@ class ModuleRegistry:
         - register(name, module)
         - get(name)
         - unregister(name)
-        - list(): return list of registered names
+        - list(): return registered names, in registration order
     """
 
+    __slots__ = ("_modules", "_names")
+
     def __init__(self) -> None:
         self._modules: dict[str, object] = {}
+        self._names: tuple[str, ...] | None = None  # Cached list() result
 
     def register(self, name: str, module: object) -> None:
+        if name not in self._modules:
+            self._names = None
         self._modules[name] = module
 
     def get(self, name: str) -> object | None:
@@ -20,7 +25,11 @@ class ModuleRegistry:
     def unregister(self, name: str) -> None:
         if name in self._modules:
             del self._modules[name]
+            self._names = None
 
     # Alias to provide a consistent API with other registries
-    def list(self) -> list[str]:
-        return list(self._modules.keys())
+    def list(self) -> tuple[str, ...]:
+        """Return the registered names; the tuple is reused until the names change."""
+        if self._names is None:
+            self._names = tuple(self._modules)
+        return self._names
@@ -7,6 +7,8 @@ manual peak helpers for use by the histogram tab.
 
 from __future__ import annotations
 
+import bisect
+import heapq
 import tkinter as tk
 from datetime import datetime
 from tkinter import ttk
@@ -16,6 +18,10 @@ from typing import Any
 from features.peak_search_feature import PeakSearchAutomatic, PeakSearchManual
 
 
+def _peak_energy(peak: dict) -> float:
+    return peak.get("energy", 0.0)
+
+
 class PeakFinderModule:
     """UI adapter used by the histogram tab.
 
@@ -29,8 +35,15 @@ class PeakFinderModule:
         self.automatic = PeakSearchAutomatic()
         self.manual = PeakSearchManual()
         self.current_hist = None
+        self._bin_lookup: tuple[Any, list[float], list[float]] | None = None  # (hist, edges, contents)
         self.peaks: list[dict] = []
         self._peaks_tree: ttk.Treeview | None = None
+        self._last_rendered: dict[str, tuple[str, str, str]] = {}  # Tree rows as last shown, in order
+        # id(peak) -> (peak, iid, raw values, formatted row); holding the
+        # peak keeps its id from being reused while the row exists
+        self._peak_rows: dict[int, tuple[dict, str, tuple, tuple[str, str, str]]] = {}
+        self._iid_peaks: dict[str, dict] = {}  # Tree iid -> peak shown in that row
+        self._next_iid = 0
         self._peaks_text: tk.Text | None = None
         self._manual_peak_var: tk.StringVar | None = None
         self._render_callback = None
@@ -47,12 +60,16 @@ class PeakFinderModule:
         self.parent_app = app
         if isinstance(peaks_widget, ttk.Treeview):
             self._peaks_tree = peaks_widget
+            self._last_rendered = {}
+            self._peak_rows = {}
+            self._iid_peaks = {}
         else:
             self._peaks_text = peaks_widget
         self._manual_peak_var = manual_peak_var
 
     def on_selection(self, app, obj, path: str) -> None:
         self.current_hist = obj
+        self._bin_lookup = None
         self.peaks = []
         self._update_peaks_display()
         self._find_peaks(app)
@@ -66,19 +83,13 @@ class PeakFinderModule:
         # Preserve manual peaks added by the user; replace only automatic peaks
         manual_peaks = [p for p in self.peaks if p.get("source") == "manual"]
 
-        # Combine automatic (found) + manual, then sort
-        new_peaks: list[dict] = []
-        if found:
-            new_peaks.extend(found)
-        if manual_peaks:
-            new_peaks.extend(manual_peaks)
-
         # If no automatic peaks were found, keep manual peaks as-is
-        if not new_peaks:
+        if not found and not manual_peaks:
             # nothing changed
             return
 
-        self.peaks = sorted(new_peaks, key=lambda p: p.get("energy", 0.0))
+        # Both lists are already in energy order, so a merge replaces the sort
+        self.peaks = list(heapq.merge(found, manual_peaks, key=_peak_energy))
         self._update_peaks_display()
         if self._render_callback:
             self._render_callback()
@@ -94,26 +105,62 @@ class PeakFinderModule:
         except Exception:
             return
         peak = self.manual.make_manual_peak(val, self.current_hist)
-        self.peaks.append(peak)
-        self.peaks.sort(key=lambda p: p["energy"])
+        bisect.insort(self.peaks, peak, key=_peak_energy)
         self._manual_peak_var.set("")
         self._update_peaks_display()
         if self._render_callback:
             self._render_callback()
 
     def _update_peaks_display(self) -> None:
-        automatic = [p for p in self.peaks if p.get("source") == "automatic"]
-        manual = [p for p in self.peaks if p.get("source") == "manual"]
         if self._peaks_tree is not None:
-            # Clear
-            for iid in list(self._peaks_tree.get_children()):
-                self._peaks_tree.delete(iid)
-            for i, peak in enumerate(self.peaks):
-                energy = f"{peak['energy']:.1f}"
-                counts = f"{peak['counts']:.0f}" if peak.get("counts") is not None else ""
-                src = peak.get("source", "")
-                self._peaks_tree.insert("", "end", iid=str(i), values=(energy, counts, src))
+            # Each peak keeps its row iid for as long as it is listed, so the
+            # tree selection follows the peak through moves and removals;
+            # only rows that are new, changed, moved or gone touch Tk
+            tree = self._peaks_tree
+            old_rows = self._last_rendered
+            old_peak_rows = self._peak_rows
+            new_rows: dict[str, tuple[str, str, str]] = {}
+            new_peak_rows: dict[int, tuple[dict, str, tuple, tuple[str, str, str]]] = {}
+            iid_peaks: dict[str, dict] = {}
+            for peak in self.peaks:
+                raw = (peak["energy"], peak.get("counts"), peak.get("source", ""))
+                known = old_peak_rows.get(id(peak))
+                if known is None:
+                    self._next_iid += 1
+                    iid = f"peak{self._next_iid}"
+                    values = None
+                else:
+                    # Reformat a peak only when its energy, counts or source changed
+                    iid = known[1]
+                    values = known[3] if known[2] == raw else None
+                if values is None:
+                    energy, counts, src = raw
+                    values = (f"{energy:.1f}", f"{counts:.0f}" if counts is not None else "", src)
+                new_peak_rows[id(peak)] = (peak, iid, raw, values)
+                new_rows[iid] = values
+                iid_peaks[iid] = peak
+            self._peak_rows = new_peak_rows
+            self._iid_peaks = iid_peaks
+
+            for iid in old_rows.keys() - new_rows.keys():
+                tree.delete(iid)
+            # Tree order of the rows, kept in step with the calls below
+            shown = [iid for iid in old_rows if iid in new_rows]
+            for index, (iid, values) in enumerate(new_rows.items()):
+                old = old_rows.get(iid)
+                if old is None:
+                    tree.insert("", index, iid=iid, values=values)
+                    shown.insert(index, iid)
+                    continue
+                if old != values:
+                    tree.item(iid, values=values)
+                if shown[index] != iid:
+                    tree.move(iid, "", index)
+                    shown.remove(iid)
+                    shown.insert(index, iid)
+            self._last_rendered = new_rows
         else:
+            automatic = [p for p in self.peaks if p.get("source") == "automatic"]
             auto_lines = []
             if automatic:
                 for i, peak in enumerate(automatic, 1):
@@ -137,50 +184,73 @@ class PeakFinderModule:
         except Exception:
             pass
 
-    def get_peak_energy_by_iid(self, iid: str) -> float | None:
+    def _peak_index_by_iid(self, iid: str) -> int | None:
+        """Return the index in self.peaks of the peak shown in tree row `iid`.
+
+        Plain list indices are still accepted for callers without a tree.
+        """
+        peak = self._iid_peaks.get(iid)
+        if peak is not None:
+            for idx, candidate in enumerate(self.peaks):
+                if candidate is peak:
+                    return idx
+            return None
         try:
             idx = int(iid)
-        except Exception:
+        except (TypeError, ValueError):
             return None
-        if 0 <= idx < len(self.peaks):
-            return float(self.peaks[idx].get("energy", 0.0))
-        return None
+        return idx if 0 <= idx < len(self.peaks) else None
+
+    def get_peak_energy_by_iid(self, iid: str) -> float | None:
+        idx = self._peak_index_by_iid(iid)
+        if idx is None:
+            return None
+        return float(self.peaks[idx].get("energy", 0.0))
 
     def set_peak_energy_by_iid(self, iid: str, energy: float) -> bool:
-        try:
-            idx = int(iid)
-        except Exception:
-            return False
-        if idx < 0 or idx >= len(self.peaks):
+        idx = self._peak_index_by_iid(iid)
+        if idx is None:
             return False
-        peak = self.peaks[idx]
+        peak = self.peaks.pop(idx)
         peak["energy"] = float(energy)
         if self.current_hist is not None:
             try:
-                peak["counts"] = self.current_hist.GetBinContent(self.current_hist.FindBin(peak["energy"]))
+                peak["counts"] = self._bin_content(peak["energy"])
             except Exception:
                 peak["counts"] = None
-        self.peaks.sort(key=lambda p: p["energy"])
+        bisect.insort(self.peaks, peak, key=_peak_energy)
         self._update_peaks_display()
         if self._render_callback:
             self._render_callback()
         return True
 
+    def _bin_content(self, energy: float) -> float:
+        """Return the content of the current histogram's bin holding `energy`.
+
+        Bin edges and contents are read from ROOT once per histogram, so
+        dragging peaks costs a bisect per move instead of FindBin and
+        GetBinContent calls. Under- and overflow follow TH1::FindBin.
+        """
+        hist = self.current_hist
+        lookup = self._bin_lookup
+        if lookup is None or lookup[0] is not hist:
+            nbins = hist.GetNbinsX()
+            edges = [hist.GetBinLowEdge(i) for i in range(1, nbins + 2)]
+            contents = [hist.GetBinContent(i) for i in range(nbins + 2)]
+            lookup = self._bin_lookup = (hist, edges, contents)
+        _, edges, contents = lookup
+        return contents[bisect.bisect_right(edges, energy)]
+
     def remove_selected_peak(self) -> None:
         if self._peaks_tree is None:
             return
         sel = self._peaks_tree.selection()
         if not sel:
             return
-        indices = []
-        for iid in sel:
-            try:
-                indices.append(int(iid))
-            except Exception:
-                continue
+        indices = {self._peak_index_by_iid(iid) for iid in sel}
+        indices.discard(None)
         for idx in sorted(indices, reverse=True):
-            if 0 <= idx < len(self.peaks):
-                del self.peaks[idx]
+            del self.peaks[idx]
         self._update_peaks_display()
         if self._render_callback:
             self._render_callback()
@@ -202,27 +272,21 @@ class PeakFinderModule:
         if self.fitting_feature is None:
             return
 
-        # Clear existing fit states and frames on the fitting feature
+        # Clear existing fits, counters and dropdown on the fitting feature
         try:
-            self.fitting_feature.fit_states.clear()
-            self.fitting_feature.fit_frames.clear()
+            self.fitting_feature.clear_fits()
         except Exception:
             pass
 
-        # Reset counters and dropdowns if present
+        # Add all fit tabs in one batch; each fit runs shortly after
         try:
-            self.fitting_feature.fit_count = 0
-            if getattr(self.fitting_feature, 'fit_dropdown', None):
-                self.fitting_feature.fit_dropdown.config(values=[])
-            if getattr(self.fitting_feature, 'fit_dropdown_var', None):
-                self.fitting_feature.fit_dropdown_var.set("")
-            self.fitting_feature.current_fit_id = None
+            self.fitting_feature.add_fits_bulk([
+                {"energy": peak.get("energy", 0), "width": 10.0, "peak_idx": None, "auto_fit": True}
+                for peak in self.peaks
+            ])
         except Exception:
             pass
 
-        # Start creating fit tabs sequentially
-        self._create_fit_tabs_sequentially(0)
-
         # Switch to Fit tab if we have a host_notebook reference
         try:
             if self.host_notebook is not None:
@@ -233,31 +297,5 @@ class PeakFinderModule:
         except Exception:
             pass
 
-    def _create_fit_tabs_sequentially(self, index: int) -> None:
-        """Create fit tabs one at a time with a small delay to avoid races."""
-        if index >= len(self.peaks):
-            return
-
-        peak = self.peaks[index]
-        energy = peak.get("energy", 0)
-        width = 10.0
-
-        try:
-            # Delegate to fitting feature to add a fit tab; preserve call signature
-            self.fitting_feature._add_fit_tab(energy=energy, width=width, peak_idx=None, auto_fit=True)
-        except Exception:
-            pass
-
-        # Schedule next tab creation
-        try:
-            if self.parent_app is not None:
-                self.parent_app.after(200, lambda: self._create_fit_tabs_sequentially(index + 1))
-        except Exception:
-            # Fallback: call directly (best-effort)
-            try:
-                self._create_fit_tabs_sequentially(index + 1)
-            except Exception:
-                pass
-
 
 __all__ = ["PeakFinderModule"]
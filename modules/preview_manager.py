@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import tkinter as tk
-from weakref import WeakKeyDictionary
+from collections import OrderedDict
 from typing import Optional
 
 from features.renderer_feature import RendererFeature
 
 
+def _options_key(render_options: dict) -> tuple:
+    """Return a hashable key for options produced by `_normalize_options`.
+
+    Normalization inserts keys in a fixed order, so the items need no
+    sorting; only list values (the markers) need converting to tuples.
+    """
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in render_options.items()
+    )
+
+
 class HistogramRenderer:
     """Combined preview manager that delegates heavy rendering to RendererFeature.
 
@@ -16,10 +28,14 @@ class HistogramRenderer:
     helps organize preview responsibilities.
     """
 
+    # Number of rendered previews kept for reuse by render_into_label
+    _IMAGE_CACHE_SIZE = 8
+
     def __init__(self) -> None:
         self._feature = RendererFeature()
-        self._pending: WeakKeyDictionary[tk.Label, dict] = WeakKeyDictionary()
         self._render_counter = 0
+        # (id(hist), width, height, options) -> (hist, PhotoImage), least recent first
+        self._image_cache: OrderedDict[tuple, tuple[object, tk.PhotoImage]] = OrderedDict()
 
     def __del__(self) -> None:
         try:
@@ -109,8 +125,23 @@ class HistogramRenderer:
                     height = height or 240
 
         render_options = self._normalize_options(options)
+        width, height = int(width), int(height)
+
+        # Resize and repaint storms ask for the same picture again; reuse it.
+        # The entry keeps the histogram alive so its id cannot be reused.
+        key = (id(hist), width, height, _options_key(render_options))
+        cached = self._image_cache.get(key)
+        if cached is not None and cached[0] is hist:
+            self._image_cache.move_to_end(key)
+            image_ref = cached[1]
+            try:
+                label.configure(image=image_ref)
+                label.image = image_ref
+            except tk.TclError:
+                pass
+            return
 
-        image_path = self._feature.render_to_temp_image(root, hist, int(width), int(height), render_options)
+        image_path = self._feature.render_to_temp_image(root, hist, width, height, render_options)
 
         try:
             image_ref = tk.PhotoImage(file=image_path)
@@ -118,6 +149,10 @@ class HistogramRenderer:
             label.image = image_ref
         except tk.TclError:
             pass
+        else:
+            self._image_cache[key] = (hist, image_ref)
+            if len(self._image_cache) > self._IMAGE_CACHE_SIZE:
+                self._image_cache.popitem(last=False)
         finally:
             try:
                 self._feature.release_temp_image(image_path)
@@ -132,31 +167,32 @@ class HistogramRenderer:
         options: dict | None = None,
         delay_ms: int = 0,
     ) -> None:
-        pending = self._pending.get(label)
-        if pending and pending.get("id") is not None:
+        # The label carries its pending render as (token, after id); a newer
+        # request cancels the older one and the token guards a late callback
+        pending = getattr(label, "_hist_pending", None)
+        if pending is not None:
             try:
-                label.after_cancel(pending["id"])
+                label.after_cancel(pending[1])
             except Exception:
                 pass
 
         self._render_counter += 1
         token = self._render_counter
-        self._pending[label] = {"id": None, "token": token}
 
         def _run() -> None:
-            current = self._pending.get(label)
-            if not current or current.get("token") != token:
+            current = getattr(label, "_hist_pending", None)
+            if current is None or current[0] != token:
                 return
-            current["id"] = None
+            label._hist_pending = None
             try:
                 self.render_into_label(root, hist, label, options)
             except Exception:
                 pass
 
         try:
-            self._pending[label]["id"] = label.after(delay_ms, _run)
+            label._hist_pending = (token, label.after(delay_ms, _run))
         except Exception:
-            pass
+            label._hist_pending = None
 
     def save_to_file(self, root, hist, path: str, width: int, height: int, options: dict | None = None) -> None:
         render_options = self._normalize_options(options)
@@ -175,6 +211,7 @@ class HistogramRenderer:
             pass
 
     def cleanup(self) -> None:
+        self._image_cache.clear()
         try:
             self._feature.cleanup()
         except Exception:
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import os
 import warnings
+from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
@@ -258,6 +260,18 @@ class SaveManager:
         except Exception:
             return None
 
+    @staticmethod
+    def _fitted_function(fit_state: dict, cached) -> str:
+        """Return the function `cached` was fitted with.
+
+        The dropdown may have changed since the fit, so it is only used
+        for results that do not record their function.
+        """
+        if cached.fit_func is not None:
+            return cached.fit_func
+        fit_func_var = fit_state.get("fit_func_var")
+        return fit_func_var.get() if hasattr(fit_func_var, "get") else "unknown"
+
     def export_fit_results_csv(
         self,
         fit_states: dict[int, dict],
@@ -291,26 +305,25 @@ class SaveManager:
                 ])
                 for tab_id, fit_state in sorted(fit_states.items()):
                     cached = fit_state.get("cached_results")
-                    if cached is None or "error" in cached:
+                    if cached is None or cached.error is not None:
                         continue
 
-                    fit_func = fit_state.get("fit_func_var", {}).get() if hasattr(fit_state.get("fit_func_var", {}), "get") else "unknown"
+                    fit_func = self._fitted_function(fit_state, cached)
                     energy = fit_state.get("energy_var", {}).get() if hasattr(fit_state.get("energy_var", {}), "get") else ""
                     width = fit_state.get("width_var", {}).get() if hasattr(fit_state.get("width_var", {}), "get") else ""
 
-                    chi2 = cached.get("chi2", "")
-                    ndf = cached.get("ndf", "")
-                    reduced_chi2 = chi2 / ndf if ndf and ndf > 0 else ""
-                    status = cached.get("status", "")
-                    parameters = cached.get("parameters", [])
-                    errors = cached.get("errors", [])
+                    chi2 = cached.chi2
+                    ndf = cached.ndf
+                    reduced_chi2 = cached.reduced_chi2 if cached.reduced_chi2 is not None else ""
+                    status = cached.status
+                    parameters = cached.parameters
+                    errors = cached.errors
 
                     fwhm = centroid = area = ""
-                    if fit_func == "gaus" and len(parameters) >= 3:
-                        constant, mean, sigma = parameters[0], parameters[1], parameters[2]
-                        fwhm = 2.355 * sigma
-                        centroid = mean
-                        area = constant * sigma * 2.506628
+                    if cached.fwhm is not None:
+                        fwhm = cached.fwhm
+                        centroid = parameters[1]
+                        area = cached.area
 
                     writer.writerow([
                         tab_id,
@@ -353,7 +366,7 @@ class SaveManager:
                 if cached is None:
                     continue
 
-                fit_func = fit_state.get("fit_func_var", {}).get() if hasattr(fit_state.get("fit_func_var", {}), "get") else "unknown"
+                fit_func = self._fitted_function(fit_state, cached)
                 energy = fit_state.get("energy_var", {}).get() if hasattr(fit_state.get("energy_var", {}), "get") else ""
                 width = fit_state.get("width_var", {}).get() if hasattr(fit_state.get("width_var", {}), "get") else ""
 
@@ -364,31 +377,30 @@ class SaveManager:
                     "width_keV": float(width) if width else None,
                 }
 
-                if "error" in cached:
-                    fit_data["error"] = cached["error"]
+                if cached.error is not None:
+                    fit_data["error"] = cached.error
                 else:
-                    chi2 = cached.get("chi2", 0)
-                    ndf = cached.get("ndf", 0)
-                    parameters = cached.get("parameters", [])
-                    errors = cached.get("errors", [])
+                    chi2 = cached.chi2
+                    ndf = cached.ndf
+                    parameters = cached.parameters
+                    errors = cached.errors
 
                     fit_data.update({
                         "chi2": chi2,
                         "ndf": ndf,
-                        "reduced_chi2": chi2 / ndf if ndf > 0 else None,
-                        "status": cached.get("status", 0),
+                        "reduced_chi2": cached.reduced_chi2,
+                        "status": cached.status,
                         "parameters": [
                             {"index": i, "value": p, "error": errors[i] if i < len(errors) else 0}
                             for i, p in enumerate(parameters)
                         ],
                     })
 
-                    if fit_func == "gaus" and len(parameters) >= 3:
-                        constant, mean, sigma = parameters[0], parameters[1], parameters[2]
+                    if cached.fwhm is not None:
                         fit_data["annotations"] = {
-                            "fwhm_keV": 2.355 * sigma,
-                            "centroid_keV": mean,
-                            "area": constant * sigma * 2.506628,
+                            "fwhm_keV": cached.fwhm,
+                            "centroid_keV": parameters[1],
+                            "area": cached.area,
                         }
                     elif fit_func == "landau" and len(parameters) >= 3:
                         fit_data["annotations"] = {
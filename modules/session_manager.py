@@ -217,7 +217,7 @@ class SessionManager:
             # Include cached results if available
             cached_results = fit_state.get("cached_results")
             if cached_results:
-                fit_data["cached_results"] = cached_results
+                fit_data["cached_results"] = cached_results.to_dict()
 
             serialized_fits.append(fit_data)
 
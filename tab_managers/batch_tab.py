@@ -11,6 +11,7 @@ from tab_managers.tab import Tab
 from modules.save_manager import ask_directory, error, info
 from modules.save_manager import SaveManager
 from modules.error_dispatcher import get_dispatcher, ErrorLevel
+from modules.fit_module import CachedFitResult
 
 
 class BatchProcessingTab(Tab):
@@ -28,6 +29,7 @@ class BatchProcessingTab(Tab):
 		self._progress_var: tk.StringVar | None = None
 		self._status_text: tk.Text | None = None
 		self._parent_app = None
+		self._root = None  # ROOT module, resolved by _get_root_module
 
 	def build_ui(self, app, parent: ttk.Frame) -> None:
 		self._parent_app = app
@@ -287,7 +289,7 @@ class BatchProcessingTab(Tab):
 
 				try:
 					fit_result = self._fit_peak(root, hist, energy, width, peak_idx)
-					if fit_result and "error" not in fit_result.get("cached_results", {}):
+					if fit_result and fit_result["cached_results"].error is None:
 						fit_states[peak_idx] = fit_result
 						result["fits_completed"] += 1
 					else:
@@ -321,7 +323,7 @@ class BatchProcessingTab(Tab):
 			peak_idx: Peak index
 
 		Returns:
-			Fit state dictionary with cached results
+			Fit state dictionary whose "cached_results" holds the CachedFitResult
 		"""
 		try:
 			xmin = energy - width / 2
@@ -339,14 +341,14 @@ class BatchProcessingTab(Tab):
 
 			# Cache results immediately
 			if fit_result and fit_result.Status() == 0:
-				num_params = len(fit_result.Parameters())
-				cached_results = {
-					"chi2": float(fit_result.Chi2()),
-					"ndf": int(fit_result.Ndf()),
-					"status": int(fit_result.Status()),
-					"parameters": list(fit_result.Parameters()),
-					"errors": [float(fit_result.ParError(i)) for i in range(num_params)],
-				}
+				cached_results = CachedFitResult.from_fit(
+					fit_func,
+					chi2=float(fit_result.Chi2()),
+					ndf=int(fit_result.Ndf()),
+					status=int(fit_result.Status()),
+					parameters=tuple(fit_result.Parameters()),
+					errors=tuple(fit_result.Errors()),
+				)
 
 				# Store in fit_state format
 				fit_state = {
@@ -361,7 +363,7 @@ class BatchProcessingTab(Tab):
 				return fit_state
 			return {
 				"tab_id": peak_idx,
-				"cached_results": {"error": "Fit failed"},
+				"cached_results": CachedFitResult(error="Fit failed"),
 			}
 
 		except Exception:
@@ -396,13 +398,17 @@ class BatchProcessingTab(Tab):
 		self._status_text.config(state=tk.DISABLED)
 
 	def _get_root_module(self):
-		"""Get ROOT module."""
+		"""Get ROOT module, resolved once and memoized in self._root on this tab."""
+		if self._root is not None:
+			return self._root
 		if self._parent_app:
 			root = getattr(self._parent_app, "ROOT", None)
 			if root is not None:
+				self._root = root
 				return root
 		try:
 			import ROOT
+			self._root = ROOT
 			return ROOT
 		except Exception:
 			return None
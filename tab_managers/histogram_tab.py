@@ -2,11 +2,100 @@ from __future__ import annotations
 
 import os
 import tkinter as tk
+import weakref
 from tkinter import ttk
+from types import MappingProxyType
 
 from modules.preview_manager import HistogramRenderer
 from modules.error_dispatcher import get_dispatcher, ErrorLevel
 
+# Defaults for objects without axes or value range (not histograms)
+_NO_AXES_DEFAULTS = MappingProxyType({
+    "x_min": 0.1,
+    "x_max": 100.1,
+    "y_min": 0.1,
+    "y_max": 120.0,
+    "x_label": "",
+    "y_label": "",
+})
+
+# id(histogram) -> axis defaults; entries are dropped when the object dies
+_axis_defaults_cache: dict[int, dict] = {}
+
+
+def _compute_axis_defaults(obj) -> dict:
+    """Return the preview's default axis ranges and labels for `obj`.
+
+    Ranges fall back to 0.1..100 (x) and 0.1..120 (y) when `obj` has no
+    axes; minimums are kept positive for log scales. Each ROOT accessor is
+    resolved once instead of being probed with hasattr first.
+
+    Results are cached per object for as long as it is alive (objects
+    that cannot be weakly referenced are not cached); callers get a copy.
+    """
+    key = id(obj)
+    cached = _axis_defaults_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    defaults = _read_axis_defaults(obj)
+    try:
+        weakref.finalize(obj, _axis_defaults_cache.pop, key, None)
+    except TypeError:
+        return defaults
+    _axis_defaults_cache[key] = defaults
+    return dict(defaults)
+
+
+def _read_axis_defaults(obj) -> dict:
+    """Read the axis defaults of `_compute_axis_defaults` from `obj`."""
+    try:
+        xaxis = obj.GetXaxis()
+    except AttributeError:
+        if not hasattr(obj, "GetMinimum"):
+            return dict(_NO_AXES_DEFAULTS)
+        xaxis = None
+    try:
+        yaxis = obj.GetYaxis()
+    except AttributeError:
+        yaxis = None
+
+    try:
+        x_min = float(xaxis.GetXmin()) if xaxis is not None else 0.1
+        x_max = float(xaxis.GetXmax()) if xaxis is not None else x_min + 100.0
+    except Exception:
+        x_min, x_max = 0.1, 100.0
+    # Ensure x_min is never 0 or negative
+    if x_min <= 0:
+        x_min = 0.1
+
+    try:
+        y_min = float(obj.GetMinimum())
+        # Scale max to be 1.2x higher
+        y_max = float(obj.GetMaximum()) * 1.2
+    except Exception:
+        y_min, y_max = 0.1, 120.0
+    # Ensure y_min is never 0 or negative
+    if y_min <= 0:
+        y_min = 0.1
+
+    labels = []
+    for axis in (xaxis, yaxis):
+        get_title = getattr(axis, "GetTitle", None)
+        try:
+            labels.append(str(get_title()) if get_title is not None else "")
+        except Exception:
+            labels.append("")
+
+    return {
+        "x_min": x_min,
+        "x_max": x_max,
+        "y_min": y_min,
+        "y_max": y_max,
+        "x_label": labels[0],
+        "y_label": labels[1],
+    }
+
+
 class HistogramTab:
     """Histogram tab view - manages multiple histogram previews and controls.
 
@@ -382,31 +471,16 @@ class HistogramPreviewRenderer:
             axis_controls.pack(fill=tk.X, padx=2, pady=(0, 0))
 
             # Determine defaults from histogram object when available
-            xaxis = obj.GetXaxis() if hasattr(obj, "GetXaxis") else None
-            yaxis = obj.GetYaxis() if hasattr(obj, "GetYaxis") else None
-            try:
-                x_min_default = float(xaxis.GetXmin()) if xaxis is not None else 0.1
-                x_max_default = float(xaxis.GetXmax()) if xaxis is not None else x_min_default + 100.0
-            except Exception:
-                x_min_default = 0.1
-                x_max_default = 100.0
-
-            # Ensure x_min_default is never 0 or negative
-            if x_min_default <= 0:
-                x_min_default = 0.1
-
-            try:
-                y_min_default = float(obj.GetMinimum()) if hasattr(obj, 'GetMinimum') else 0.1
-                y_max_default = float(obj.GetMaximum()) if hasattr(obj, 'GetMaximum') else y_min_default + 100.0
-                # Scale max to be 1.2x higher
-                y_max_default = y_max_default * 1.2
-            except Exception:
-                y_min_default = 0.1
-                y_max_default = 120.0
+            defaults = _compute_axis_defaults(obj)
+            x_min_default = defaults["x_min"]
+            x_max_default = defaults["x_max"]
+            y_min_default = defaults["y_min"]
+            y_max_default = defaults["y_max"]
 
-            # Ensure y_min_default is never 0 or negative
-            if y_min_default <= 0:
-                y_min_default = 0.1
+            # Upper scroll limits for the min/max boxes, computed once
+            # instead of on every wheel event
+            x_scroll_limit = x_max_default * 2.5
+            y_scroll_limit = y_max_default * 2.5
 
             # Variables for sliders (edge vars kept for compatibility)
             self._xmin_var = tk.DoubleVar(value=x_min_default)
@@ -419,37 +493,17 @@ class HistogramPreviewRenderer:
             self._logy_var = tk.BooleanVar(value=True)
 
             # Axis label variables
-            x_label_default = ""
-            y_label_default = ""
-            try:
-                if xaxis is not None and hasattr(xaxis, 'GetTitle'):
-                    x_label_default = str(xaxis.GetTitle())
-            except Exception:
-                pass
-            try:
-                if yaxis is not None and hasattr(yaxis, 'GetTitle'):
-                    y_label_default = str(yaxis.GetTitle())
-            except Exception:
-                pass
+            x_label_default = defaults["x_label"]
+            y_label_default = defaults["y_label"]
             
             self._xlabel_var = tk.StringVar(value=x_label_default)
             self._ylabel_var = tk.StringVar(value=y_label_default)
 
-            # Helper to schedule renders (debounced)
+            # Pending debounced render (see _schedule_render)
             self._pending_after = {"id": None}
-            def _schedule_render(delay=150):
-                try:
-                    app = getattr(self, "_app", None)
-                    if not app:
-                        return
-                    if self._pending_after["id"] is not None:
-                        try:
-                            app.after_cancel(self._pending_after["id"])
-                        except Exception:
-                            pass
-                    self._pending_after["id"] = app.after(delay, lambda: self.render_preview(self._current_obj))
-                except Exception:
-                    pass
+            # Wheel ticks waiting for the next flush (see _queue_scroll)
+            self._pending_scroll = {}
+            self._scroll_flush_id = None
 
             # X range controls: center and width with text boxes
             xframe = ttk.Frame(axis_controls)
@@ -473,24 +527,8 @@ class HistogramPreviewRenderer:
             x_min_text.pack(side=tk.LEFT, padx=(0, 4))
             
             # Format X min on focus out and validate
-            def _format_xmin(event=None):
-                try:
-                    val = float(self._xmin_var.get())
-                    # Ensure min is never 0 or negative
-                    if val <= 0:
-                        val = 0.1
-                    # Ensure min doesn't cross max
-                    xmax = float(self._xmax_var.get())
-                    if val >= xmax:
-                        val = xmax - 1.0
-                    self._xmin_var.set(f"{val:.1f}")
-                except (ValueError, tk.TclError):
-                    pass
-                self._schedule_render()
-            x_min_text.bind("<FocusOut>", _format_xmin)
-            x_min_text.bind("<MouseWheel>", lambda e: self._on_min_scroll(e, self._xmin_var, self._xmax_var, x_min_default, x_max_default * 2.5))
-            x_min_text.bind("<Button-4>", lambda e: self._on_min_scroll(e, self._xmin_var, self._xmax_var, x_min_default, x_max_default * 2.5))
-            x_min_text.bind("<Button-5>", lambda e: self._on_min_scroll(e, self._xmin_var, self._xmax_var, x_min_default, x_max_default * 2.5))
+            x_min_text.bind("<FocusOut>", lambda e: self._format_min_box(self._xmin_var, self._xmax_var))
+            self._bind_wheel(x_min_text, lambda e, d: self._queue_scroll(self._on_min_scroll, self._xmin_var, self._xmax_var, x_min_default, x_scroll_limit, d))
             
             # X Max control
             x_max_label = ttk.Label(xframe, text="X max:", width=8)
@@ -499,21 +537,8 @@ class HistogramPreviewRenderer:
             x_max_text.pack(side=tk.LEFT, padx=(0, 4))
             
             # Format X max on focus out and validate
-            def _format_xmax(event=None):
-                try:
-                    val = float(self._xmax_var.get())
-                    # Ensure max doesn't cross min
-                    xmin = float(self._xmin_var.get())
-                    if val <= xmin:
-                        val = xmin + 1.0
-                    self._xmax_var.set(f"{val:.1f}")
-                except (ValueError, tk.TclError):
-                    pass
-                self._schedule_render()
-            x_max_text.bind("<FocusOut>", _format_xmax)
-            x_max_text.bind("<MouseWheel>", lambda e: self._on_max_scroll(e, self._xmax_var, self._xmin_var, x_min_default, x_max_default * 2.5))
-            x_max_text.bind("<Button-4>", lambda e: self._on_max_scroll(e, self._xmax_var, self._xmin_var, x_min_default, x_max_default * 2.5))
-            x_max_text.bind("<Button-5>", lambda e: self._on_max_scroll(e, self._xmax_var, self._xmin_var, x_min_default, x_max_default * 2.5))
+            x_max_text.bind("<FocusOut>", lambda e: self._format_max_box(self._xmax_var, self._xmin_var))
+            self._bind_wheel(x_max_text, lambda e, d: self._queue_scroll(self._on_max_scroll, self._xmax_var, self._xmin_var, x_min_default, x_scroll_limit, d))
             
             # Log X checkbox (aligned to the left near the entry boxes)
             logx_checkbox = ttk.Checkbutton(xframe, text="Log X", variable=self._logx_var, command=lambda: self._schedule_render())
@@ -541,24 +566,8 @@ class HistogramPreviewRenderer:
             y_min_text.pack(side=tk.LEFT, padx=(0, 4))
             
             # Format Y min on focus out and validate
-            def _format_ymin(event=None):
-                try:
-                    val = float(self._ymin_var.get())
-                    # Ensure min is never 0 or negative
-                    if val <= 0:
-                        val = 0.1
-                    # Ensure min doesn't cross max
-                    ymax = float(self._ymax_var.get())
-                    if val >= ymax:
-                        val = ymax - 1.0
-                    self._ymin_var.set(f"{val:.1f}")
-                except (ValueError, tk.TclError):
-                    pass
-                self._schedule_render()
-            y_min_text.bind("<FocusOut>", _format_ymin)
-            y_min_text.bind("<MouseWheel>", lambda e: self._on_min_scroll(e, self._ymin_var, self._ymax_var, y_min_default, y_max_default * 2.5))
-            y_min_text.bind("<Button-4>", lambda e: self._on_min_scroll(e, self._ymin_var, self._ymax_var, y_min_default, y_max_default * 2.5))
-            y_min_text.bind("<Button-5>", lambda e: self._on_min_scroll(e, self._ymin_var, self._ymax_var, y_min_default, y_max_default * 2.5))
+            y_min_text.bind("<FocusOut>", lambda e: self._format_min_box(self._ymin_var, self._ymax_var))
+            self._bind_wheel(y_min_text, lambda e, d: self._queue_scroll(self._on_min_scroll, self._ymin_var, self._ymax_var, y_min_default, y_scroll_limit, d))
             
             # Y Max control
             y_max_label = ttk.Label(yframe, text="Y max:", width=8)
@@ -567,21 +576,8 @@ class HistogramPreviewRenderer:
             y_max_text.pack(side=tk.LEFT, padx=(0, 2))
             
             # Format Y max on focus out and validate
-            def _format_ymax(event=None):
-                try:
-                    val = float(self._ymax_var.get())
-                    # Ensure max doesn't cross min
-                    ymin = float(self._ymin_var.get())
-                    if val <= ymin:
-                        val = ymin + 1.0
-                    self._ymax_var.set(f"{val:.1f}")
-                except (ValueError, tk.TclError):
-                    pass
-                self._schedule_render()
-            y_max_text.bind("<FocusOut>", _format_ymax)
-            y_max_text.bind("<MouseWheel>", lambda e: self._on_max_scroll(e, self._ymax_var, self._ymin_var, y_min_default, y_max_default * 2.5))
-            y_max_text.bind("<Button-4>", lambda e: self._on_max_scroll(e, self._ymax_var, self._ymin_var, y_min_default, y_max_default * 2.5))
-            y_max_text.bind("<Button-5>", lambda e: self._on_max_scroll(e, self._ymax_var, self._ymin_var, y_min_default, y_max_default * 2.5))
+            y_max_text.bind("<FocusOut>", lambda e: self._format_max_box(self._ymax_var, self._ymin_var))
+            self._bind_wheel(y_max_text, lambda e, d: self._queue_scroll(self._on_max_scroll, self._ymax_var, self._ymin_var, y_min_default, y_scroll_limit, d))
 
             # Log Y checkbox (aligned to the left near the entry boxes)
             logy_checkbox = ttk.Checkbutton(yframe, text="Log Y", variable=self._logy_var, command=lambda: self._schedule_render())
@@ -616,7 +612,7 @@ class HistogramPreviewRenderer:
                     self._ymax_var.set(ymax)
                 except Exception:
                     pass
-                _schedule_render()
+                self._schedule_render()
 
             # Trace changes to min/max vars
             try:
@@ -668,36 +664,38 @@ class HistogramPreviewRenderer:
 
         # Compute explicit target sizes from the window: width uses ~80%
         # of window width, height uses at most 50% of window height.
-        w = int(max(160, win_w * 0.8))
-        h = int(max(120, win_h * 0.5))
+        # winfo sizes are integer pixels, so stay in integer arithmetic
+        w = max(160, win_w * 4 // 5)
+        h = max(120, win_h // 2)
 
         # Pass explicit target size and prefer height so vertical whitespace
         # is limited by the renderer. Also include any axis range controls
         # from the sliders so the previewer and renderer can honor zoom.
-        options = {"target_width": int(w), "target_height": int(h), "priority": "height"}
+        options = {"target_width": w, "target_height": h, "priority": "height"}
 
+        # The axis controls create all their variables together: the four
+        # ranges are read and converted in one go, then the log scales
+        # and labels
         try:
-            if hasattr(self, "_xmin_var") and hasattr(self, "_xmax_var"):
-                options["xmin"] = float(self._xmin_var.get())
-                options["xmax"] = float(self._xmax_var.get())
-            if hasattr(self, "_ymin_var") and hasattr(self, "_ymax_var"):
-                options["ymin"] = float(self._ymin_var.get())
-                options["ymax"] = float(self._ymax_var.get())
-            # Add log scale options
-            if hasattr(self, "_logx_var"):
-                options["logx"] = self._logx_var.get()
-            if hasattr(self, "_logy_var"):
-                options["logy"] = self._logy_var.get()
-            # Add axis labels
-            if hasattr(self, "_xlabel_var"):
-                xlabel = self._xlabel_var.get()
-                if xlabel:
-                    options["xlabel"] = xlabel
-            if hasattr(self, "_ylabel_var"):
-                ylabel = self._ylabel_var.get()
-                if ylabel:
-                    options["ylabel"] = ylabel
-        except Exception:
+            xmin, xmax, ymin, ymax = (
+                float(self._xmin_var.get()),
+                float(self._xmax_var.get()),
+                float(self._ymin_var.get()),
+                float(self._ymax_var.get()),
+            )
+        except (AttributeError, ValueError, tk.TclError):
+            pass  # No axis controls, or a box holds a half-typed number
+        else:
+            options.update(xmin=xmin, xmax=xmax, ymin=ymin, ymax=ymax)
+
+        try:
+            options.update(logx=self._logx_var.get(), logy=self._logy_var.get())
+            # Empty axis labels keep the histogram's own titles
+            for key, var in (("xlabel", self._xlabel_var), ("ylabel", self._ylabel_var)):
+                text = var.get()
+                if text:
+                    options[key] = text
+        except (AttributeError, tk.TclError):
             pass
 
         if pm:
@@ -712,15 +710,81 @@ class HistogramPreviewRenderer:
         except Exception:
             pass
 
-    def _on_min_scroll(self, event, min_var, max_var, min_limit, max_limit, step=0.5):
-        """Handle scroll wheel on min value text box."""
+    def _format_min_box(self, min_var, max_var) -> None:
+        """Validate and format a min box on focus out, then re-render."""
+        try:
+            val = float(min_var.get())
+            # Ensure min is never 0 or negative
+            if val <= 0:
+                val = 0.1
+            # Ensure min doesn't cross max
+            max_val = float(max_var.get())
+            if val >= max_val:
+                val = max_val - 1.0
+            min_var.set(f"{val:.1f}")
+        except (ValueError, tk.TclError):
+            pass
+        self._schedule_render()
+
+    def _format_max_box(self, max_var, min_var) -> None:
+        """Validate and format a max box on focus out, then re-render."""
+        try:
+            val = float(max_var.get())
+            # Ensure max doesn't cross min
+            min_val = float(min_var.get())
+            if val <= min_val:
+                val = min_val + 1.0
+            max_var.set(f"{val:.1f}")
+        except (ValueError, tk.TclError):
+            pass
+        self._schedule_render()
+
+    @staticmethod
+    def _bind_wheel(entry, on_scroll) -> None:
+        """Bind the wheel events of `entry` to on_scroll(event, direction).
+
+        The direction (+1 up, -1 down) is fixed per binding: X11 reports
+        it through the button number, <MouseWheel> through the delta sign.
+        """
+        entry.bind("<MouseWheel>", lambda e: on_scroll(e, -1 if e.delta < 0 else 1))
+        entry.bind("<Button-4>", lambda e: on_scroll(e, 1))
+        entry.bind("<Button-5>", lambda e: on_scroll(e, -1))
+
+    def _queue_scroll(self, handler, var, other_var, min_limit, max_limit, direction, delay=16) -> None:
+        """Accumulate a wheel tick for `var` and apply the net ticks on one flush.
+
+        Touchpads deliver wheel events far faster than the preview can follow,
+        so ticks arriving within `delay` ms become a single step of n ticks.
+        """
+        app = getattr(self, "_app", None)
+        if not app:
+            handler(None, var, other_var, min_limit, max_limit, direction=direction)
+            return
+        key = str(var)
+        pending = self._pending_scroll.get(key)
+        if pending is None:
+            self._pending_scroll[key] = [handler, var, other_var, min_limit, max_limit, direction]
+        else:
+            pending[5] += direction
+        if self._scroll_flush_id is None:
+            try:
+                self._scroll_flush_id = app.after(delay, self._flush_scroll)
+            except Exception:
+                self._flush_scroll()
+
+    def _flush_scroll(self) -> None:
+        """Apply the wheel ticks collected by _queue_scroll."""
+        self._scroll_flush_id = None
+        pending, self._pending_scroll = self._pending_scroll, {}
+        for handler, var, other_var, min_limit, max_limit, ticks in pending.values():
+            if ticks:
+                handler(None, var, other_var, min_limit, max_limit, direction=ticks)
+
+    def _on_min_scroll(self, event, min_var, max_var, min_limit, max_limit, step=0.5, direction=1):
+        """Move a min box by `direction` wheel ticks (negative scrolls down)."""
         try:
-            current = float(min_var.get())
             # Scroll up increases value, scroll down decreases
-            if event.num == 5 or (hasattr(event, 'delta') and event.delta < 0):
-                current -= step
-            else:
-                current += step
+            current = float(min_var.get()) + step * direction
             
             # Clamp min to limits and ensure it doesn't exceed max
             current = max(min_limit, current)
@@ -730,26 +794,24 @@ class HistogramPreviewRenderer:
             if current <= 0:
                 current = 0.1
             
+            # One decimal, like the focus-out formatting
             min_var.set(f"{current:.1f}")
             self._schedule_render()
         except Exception:
             pass
 
-    def _on_max_scroll(self, event, max_var, min_var, min_limit, max_limit, step=0.5):
-        """Handle scroll wheel on max value text box."""
+    def _on_max_scroll(self, event, max_var, min_var, min_limit, max_limit, step=0.5, direction=1):
+        """Move a max box by `direction` wheel ticks (negative scrolls down)."""
         try:
-            current = float(max_var.get())
             # Scroll up increases value, scroll down decreases
-            if event.num == 5 or (hasattr(event, 'delta') and event.delta < 0):
-                current -= step
-            else:
-                current += step
+            current = float(max_var.get()) + step * direction
             
             # Clamp max to limits and ensure it doesn't go below min
             current = min(max_limit, current)
             min_val = float(min_var.get())
             current = max(current, min_val + 1.0)
             
+            # One decimal, like the focus-out formatting
             max_var.set(f"{current:.1f}")
             self._schedule_render()
         except Exception:
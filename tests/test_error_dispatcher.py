@@ -0,0 +1,136 @@
+"""
+Tests for the centralized ErrorDispatcher.
+
+Covers event serialization and handler subscription/dispatch.  These tests
+do not touch tkinter or ROOT.
+
+Usage:
+    python -m pytest tests/test_error_dispatcher.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.error_dispatcher import ErrorDispatcher, ErrorEvent, ErrorLevel
+
+
+class TestErrorEvent(unittest.TestCase):
+    """Tests for ErrorEvent serialization."""
+
+    def test_to_dict_with_exception(self):
+        """to_dict reports the exception type name and message."""
+        event = ErrorEvent(ErrorLevel.WARNING, "failed", "ctx", exception=ValueError("bad value"))
+        data = event.to_dict()
+        self.assertEqual(data["exception_type"], "ValueError")
+        self.assertEqual(data["exception_message"], "bad value")
+        self.assertEqual(data["level"], "WARNING")
+        self.assertEqual(data["context"], "ctx")
+
+    def test_to_dict_without_exception(self):
+        """to_dict reports None for exception fields when none was given."""
+        data = ErrorEvent(ErrorLevel.INFO, "note").to_dict()
+        self.assertIsNone(data["exception_type"])
+        self.assertIsNone(data["exception_message"])
+
+
+class TestErrorDispatcherHandlers(unittest.TestCase):
+    """Tests for handler subscription and dispatch."""
+
+    def setUp(self):
+        ErrorDispatcher.reset()
+        self.dispatcher = ErrorDispatcher.get_instance()
+
+    def tearDown(self):
+        ErrorDispatcher.reset()
+
+    def test_subscribed_handler_receives_event(self):
+        """A handler subscribed to a level receives events of that level only."""
+        received = []
+        self.dispatcher.subscribe(ErrorLevel.WARNING, received.append)
+        self.dispatcher.emit(ErrorLevel.WARNING, "w", context="test")
+        self.dispatcher.emit(ErrorLevel.INFO, "i", context="test")
+        self.assertEqual([e.message for e in received], ["w"])
+
+    def test_duplicate_subscribe_is_ignored(self):
+        """Subscribing the same handler twice invokes it once per event."""
+        received = []
+        self.dispatcher.subscribe(ErrorLevel.INFO, received.append)
+        self.dispatcher.subscribe(ErrorLevel.INFO, received.append)
+        self.dispatcher.emit(ErrorLevel.INFO, "i", context="test")
+        self.assertEqual(len(received), 1)
+
+    def test_unsubscribe_stops_delivery(self):
+        """After unsubscribe the handler is no longer invoked."""
+        received = []
+        self.dispatcher.subscribe(ErrorLevel.INFO, received.append)
+        self.dispatcher.unsubscribe(ErrorLevel.INFO, received.append)
+        self.dispatcher.emit(ErrorLevel.INFO, "i", context="test")
+        self.assertEqual(received, [])
+
+    def test_bound_method_handler_is_weak(self):
+        """A bound-method handler is dropped once its owner is collected."""
+        import gc
+
+        received = []
+
+        class _Owner:
+            def on_event(self, event):
+                received.append(event)
+
+        owner = _Owner()
+        self.dispatcher.subscribe(ErrorLevel.INFO, owner.on_event)
+        self.dispatcher.emit(ErrorLevel.INFO, "first", context="test")
+        del owner
+        gc.collect()
+        self.dispatcher.emit(ErrorLevel.INFO, "second", context="test")
+
+        self.assertEqual([e.message for e in received], ["first"])
+        self.assertEqual(self.dispatcher._handler_tuples[ErrorLevel.INFO], ())
+
+    def test_unsubscribe_bound_method(self):
+        """Unsubscribing a bound method matches the weakly held entry."""
+        received = []
+
+        class _Owner:
+            def on_event(self, event):
+                received.append(event)
+
+        owner = _Owner()
+        self.dispatcher.subscribe(ErrorLevel.INFO, owner.on_event)
+        self.dispatcher.unsubscribe(ErrorLevel.INFO, owner.on_event)
+        self.dispatcher.emit(ErrorLevel.INFO, "i", context="test")
+        self.assertEqual(received, [])
+
+    def test_level_specific_emit(self):
+        """emit_warning behaves like emit(ErrorLevel.WARNING, ...)."""
+        received = []
+        self.dispatcher.subscribe(ErrorLevel.WARNING, received.append)
+        event = self.dispatcher.emit_warning("w", context="test", exception=KeyError("k"))
+        self.assertIs(received[0], event)
+        self.assertEqual(event.level, ErrorLevel.WARNING)
+        self.assertIs(self.dispatcher.get_history()[-1], event)
+
+
+    def test_debug_is_opt_in(self):
+        """DEBUG is off by default and follows the logger level."""
+        import logging
+
+        logger = self.dispatcher._logger
+        previous = logger.level
+        self.assertFalse(self.dispatcher.debug_enabled())
+        try:
+            logger.setLevel(logging.DEBUG)
+            self.assertTrue(self.dispatcher.debug_enabled())
+        finally:
+            logger.setLevel(previous)
+
+
+if __name__ == "__main__":
+    unittest.main()
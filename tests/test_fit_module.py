@@ -0,0 +1,388 @@
+"""
+Tests for FittingFeature helpers that do not need a display or ROOT.
+
+Usage:
+    python -m pytest tests/test_fit_module.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.fit_module import (
+    CachedFitResult,
+    FittingFeature,
+    _poly_least_squares,
+    _set_fit_option_letters,
+    _text_line_edits,
+)
+
+
+def _make_uniform_hist(xmin: float = 0.0, xmax: float = 100.0, nbins: int = 50) -> MagicMock:
+    """Return a mock TH1 with a uniformly binned x axis."""
+    hist = MagicMock()
+    xaxis = hist.GetXaxis.return_value
+    xaxis.GetXbins.return_value.GetSize.return_value = 0
+    xaxis.GetXmin.return_value = xmin
+    xaxis.GetXmax.return_value = xmax
+    xaxis.GetBinWidth.return_value = (xmax - xmin) / nbins
+    xaxis.GetNbins.return_value = nbins
+    return hist
+
+
+class _Var:
+    """Minimal stand-in for a Tk variable."""
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def _make_fit_harness(options: str = "SQ", idle: list | None = None) -> tuple[FittingFeature, dict, MagicMock]:
+    """Return a feature, a fit state and the fitting clone, with ROOT mocked.
+
+    Idle callbacks are appended to `idle` when given; otherwise they run
+    immediately, so a requested fit runs all its stages. The mocked TF1
+    reports a Gaussian fit of (100, 662, 2) with NDF 10.
+    """
+    feature = FittingFeature()
+    feature._app = MagicMock()
+    feature._app.after_idle.side_effect = idle.append if idle is not None else lambda callback: callback()
+    feature._root = MagicMock()
+    feature._TF1 = MagicMock()
+    tf1 = feature._TF1.return_value
+    tf1.GetNpar.return_value = 3
+    tf1.GetNDF.return_value = 10
+    tf1.GetChisquare.return_value = 12.0
+    tf1.GetParameters.side_effect = AttributeError
+    tf1.GetParameter.side_effect = (100.0, 662.0, 2.0).__getitem__
+    tf1.GetParError.return_value = 0.1
+    feature._gROOT = MagicMock()
+    hist = MagicMock()
+    feature.current_hist = hist
+    with patch("modules.fit_module.tk.StringVar", _Var):
+        fit_state = feature._new_fit_state(energy=662.0, width=20.0, fit_id=1)
+    fit_state["fit_options_var"].set(options)
+    fit_state["param_entries"] = [_Var("100"), _Var("662"), _Var("2")]
+    fit_state["param_fixed_vars"] = [_Var(False)] * 3
+    return feature, fit_state, hist.Clone.return_value
+
+
+class TestFitOptions(unittest.TestCase):
+    """Tests for the option string handed to TH1::Fit."""
+
+    def test_full_fit_forces_s_and_n(self):
+        """A settled fit keeps the user options and adds S and N."""
+        feature, fit_state, clone = _make_fit_harness("SQ")
+        feature._perform_fit_for_tab(feature._app, fit_state)
+        self.assertEqual(clone.Fit.call_args[0][1], "QSN")
+
+    def test_fast_preview_is_quiet_and_draws_nothing(self):
+        """While edits settle the fit also gets Q and 0."""
+        feature, fit_state, clone = _make_fit_harness("SQ")
+        fit_state["fast_preview"] = True
+        feature._perform_fit_for_tab(feature._app, fit_state)
+        self.assertEqual(clone.Fit.call_args[0][1], "SNQ0")
+
+
+class TestFitStages(unittest.TestCase):
+    """Tests for fits whose inputs change while the stages are queued."""
+
+    def test_results_belong_to_the_fitted_function(self):
+        """Switching the function between stages does not relabel the fit."""
+        idle: list = []
+        feature, fit_state, _clone = _make_fit_harness(idle=idle)
+        feature._perform_fit_for_tab(feature._app, fit_state)
+        fit_state["fit_func_var"].set("pol1")
+        while idle:
+            idle.pop(0)()
+
+        cached = fit_state["cached_results"]
+        self.assertEqual(cached.fit_func, "gaus")
+        self.assertAlmostEqual(cached.fwhm, 4.71)
+
+    def test_results_text_describes_the_fitted_function(self):
+        """The results text names the fitted function and typed options, even after a switch."""
+        idle: list = []
+        feature, fit_state, _clone = _make_fit_harness(idle=idle)
+        fit_state["fit_result_text"] = MagicMock()
+        feature._perform_fit_for_tab(feature._app, fit_state)
+        fit_state["fit_func_var"].set("pol1")
+        fit_state["fit_options_var"].set("SQR")
+        while idle:
+            idle.pop(0)()
+
+        text = fit_state["_last_text"]
+        self.assertTrue(text.startswith("Fit Function: gaus\nFit Options: SQ\n"))
+        self.assertIn("  Sigma = 2.000000", text)
+
+    def test_retyped_options_show_in_results(self):
+        """Options that force the same TH1::Fit string still update the text."""
+        feature, fit_state, clone = _make_fit_harness("SQ")
+        fit_state["fit_result_text"] = MagicMock()
+        feature._perform_fit_for_tab(feature._app, fit_state)
+        fit_state["fit_options_var"].set("QS")
+        feature._perform_fit_for_tab(feature._app, fit_state)
+
+        self.assertEqual(clone.Fit.call_args[0][1], "QSN")
+        self.assertIn("\nFit Options: QS\n", fit_state["_last_text"])
+
+
+class TestFitFailed(unittest.TestCase):
+    """Tests for reporting a failed fit."""
+
+    def _fail(self, debug: bool):
+        feature, fit_state, _clone = _make_fit_harness()
+        feature._dispatcher = MagicMock()
+        feature._dispatcher.debug_enabled.return_value = debug
+        fit_state["fit_result_text"] = MagicMock()
+        fit_state["param_entries"][1].set("66e")
+        feature._perform_fit_for_tab(feature._app, fit_state)
+        return feature._dispatcher.emit_warning.call_args, fit_state
+
+    def test_parse_error_is_one_line_without_traceback(self):
+        """A half-typed parameter gives a short warning and results message."""
+        call, fit_state = self._fail(debug=False)
+        self.assertTrue(call[0][0].startswith("Fit failed: "))
+        self.assertIsNone(call[1]["exception"])
+        self.assertTrue(fit_state["_last_text"].startswith("Fit failed: "))
+        self.assertFalse(fit_state["has_fit"])
+
+    def test_debug_attaches_the_exception(self):
+        """With DEBUG logging on the warning carries the exception."""
+        call, _fit_state = self._fail(debug=True)
+        self.assertIsInstance(call[1]["exception"], ValueError)
+
+
+class TestFindBin(unittest.TestCase):
+    """Tests for the cached-axis bin lookup."""
+
+    def test_uniform_axis_matches_findbin_convention(self):
+        """Bins are 1-based with underflow 0 and overflow nbins+1."""
+        hist = _make_uniform_hist()
+        stats: dict = {}
+        self.assertEqual(FittingFeature._find_bin(hist, stats, 0.0), 1)
+        self.assertEqual(FittingFeature._find_bin(hist, stats, 3.9), 2)
+        self.assertEqual(FittingFeature._find_bin(hist, stats, 99.99), 50)
+        self.assertEqual(FittingFeature._find_bin(hist, stats, -1.0), 0)
+        self.assertEqual(FittingFeature._find_bin(hist, stats, 100.0), 51)
+        hist.FindBin.assert_not_called()
+        hist.GetXaxis.assert_called_once()
+
+    def test_variable_axis_defers_to_root(self):
+        """Variable-width axes fall back to TH1::FindBin."""
+        hist = MagicMock()
+        hist.GetXaxis.return_value.GetXbins.return_value.GetSize.return_value = 11
+        hist.FindBin.return_value = 7
+        stats: dict = {}
+        self.assertEqual(FittingFeature._find_bin(hist, stats, 12.5), 7)
+        self.assertIsNone(stats["axis"])
+
+
+class TestGetClone(unittest.TestCase):
+    """Tests for the lazily created fitting clone."""
+
+    def _make_feature(self, hist) -> FittingFeature:
+        feature = FittingFeature.__new__(FittingFeature)
+        feature.current_hist = hist
+        feature.current_hist_clone = None
+        feature._dispatcher = MagicMock()
+        return feature
+
+    def test_clones_once_on_first_use(self):
+        """The histogram is cloned on the first request and then reused."""
+        hist = MagicMock()
+        hist.GetName.return_value = "h1"
+        feature = self._make_feature(hist)
+        clone = feature._get_clone()
+        self.assertIs(feature._get_clone(), clone)
+        hist.Clone.assert_called_once_with("h1_fit_clone")
+
+    def test_clone_failure_uses_original(self):
+        """A failing Clone falls back to fitting the original histogram."""
+        hist = MagicMock()
+        hist.Clone.side_effect = RuntimeError("no clone")
+        feature = self._make_feature(hist)
+        self.assertIs(feature._get_clone(), hist)
+        feature._dispatcher.emit_info.assert_called_once()
+
+
+class TestCacheParamValues(unittest.TestCase):
+    """Tests for the parsed start-value cache."""
+
+    def test_skips_empty_entries_and_keys_by_text(self):
+        """Empty entries are left out and the texts become the cache key."""
+        fit_state = {}
+        texts = ("100", "", "2.5")
+        self.assertEqual(FittingFeature._cache_param_values(fit_state, texts), (100.0, 2.5))
+        self.assertEqual(fit_state["_params_cache"], (texts, (100.0, 2.5)))
+
+    def test_invalid_text_keeps_previous_cache(self):
+        """A half-typed number raises and leaves the cache untouched."""
+        fit_state = {"_params_cache": (("1",), (1.0,))}
+        with self.assertRaises(ValueError):
+            FittingFeature._cache_param_values(fit_state, ("1e",))
+        self.assertEqual(fit_state["_params_cache"], (("1",), (1.0,)))
+
+
+class TestSetFitOptionLetters(unittest.TestCase):
+    """Tests for forcing single-letter fit options."""
+
+    def test_letters_are_given_once(self):
+        """Forced letters replace any the user typed, in either case."""
+        self.assertEqual(_set_fit_option_letters("SQ", "SN"), "QSN")
+        self.assertEqual(_set_fit_option_letters("nsRw", "SN"), "RwSN")
+        self.assertEqual(_set_fit_option_letters("", "SN"), "SN")
+
+    def test_keywords_are_kept_intact(self):
+        """Multi-letter keywords keep their letters and are not read as options."""
+        self.assertEqual(_set_fit_option_letters("SERIAL", "SN"), "SN SERIAL")
+        self.assertEqual(_set_fit_option_letters("Q MULTITHREAD", "SN"), "QSN MULTITHREAD")
+        self.assertEqual(_set_fit_option_letters("ROB=0.8 EX0", "SN"), "SN ROB=0.8 EX0")
+
+
+class TestParamsFrameTitle(unittest.TestCase):
+    """Tests for the "Initial Parameters" frame title."""
+
+    def test_titles_use_display_names(self):
+        """Known functions show their display name, others their key."""
+        self.assertEqual(FittingFeature._params_frame_title("gaus"), "Initial Parameters (Gaussian)")
+        self.assertEqual(FittingFeature._params_frame_title("pol2"), "Initial Parameters (Quadratic)")
+        self.assertEqual(FittingFeature._params_frame_title("custom"), "Initial Parameters (custom)")
+
+
+class TestFormatPeakLabels(unittest.TestCase):
+    """Tests for batch peak label formatting."""
+
+    def test_labels_match_per_peak_formatting(self):
+        """Tab and info texts carry the energy, counts and estimated width."""
+        labels = FittingFeature._format_peak_labels([
+            {"energy": 661.657, "counts": 1234.56},
+            {"energy": 100.0},
+        ])
+        self.assertEqual(labels[0][0], "Peak 1 (662 keV)")
+        self.assertEqual(
+            labels[0][1],
+            "Energy: 661.66 keV\nCounts: 1234.6\nEst. Width: 33.08 keV",
+        )
+        self.assertEqual(labels[1][0], "Peak 2 (100 keV)")
+        self.assertTrue(labels[1][1].endswith("Est. Width: 10.00 keV"))
+
+
+class TestPolyLeastSquares(unittest.TestCase):
+    """Tests for the polynomial start-value estimator."""
+
+    def test_recovers_exact_cubic(self):
+        """Noise-free cubic data yields its own coefficients."""
+        coeffs = (5.0, -0.3, 0.002, -1e-6)
+        xs = [500.0 + 2.0 * i for i in range(40)]
+        ys = [sum(c * x ** k for k, c in enumerate(coeffs)) for x in xs]
+        result = _poly_least_squares(xs, ys, 3)
+        for got, expected in zip(result, coeffs):
+            self.assertAlmostEqual(got, expected, delta=1e-6 * max(1.0, abs(expected)))
+
+    def test_too_few_points_returns_none(self):
+        """An underdetermined system gives no seed."""
+        self.assertIsNone(_poly_least_squares([1.0, 2.0], [1.0, 2.0], 2))
+
+    def test_repeated_x_is_singular(self):
+        """Identical x values cannot determine a slope."""
+        self.assertIsNone(_poly_least_squares([3.0, 3.0, 3.0], [1.0, 2.0, 3.0], 1))
+
+
+class TestCachedFitResult(unittest.TestCase):
+    """Tests for the cached fit result record."""
+
+    def test_to_dict_success(self):
+        """Successful results serialize every field with list values."""
+        cached = CachedFitResult(chi2=1.5, ndf=3, status=0, parameters=(1.0, 2.0), errors=(0.1, 0.2))
+        self.assertEqual(cached.to_dict(), {
+            "chi2": 1.5,
+            "ndf": 3,
+            "status": 0,
+            "parameters": [1.0, 2.0],
+            "errors": [0.1, 0.2],
+        })
+
+    def test_from_fit_derives_gaussian_annotations(self):
+        """Gaussian results carry reduced chi2, FWHM and area."""
+        cached = CachedFitResult.from_fit("gaus", chi2=8.0, ndf=4, status=0, parameters=(100.0, 662.0, 2.0), errors=(1.0, 0.1, 0.05))
+        self.assertEqual(cached.reduced_chi2, 2.0)
+        self.assertAlmostEqual(cached.fwhm, 4.71)
+        self.assertAlmostEqual(cached.area, 501.3256)
+
+    def test_from_fit_non_gaussian(self):
+        """Other functions get no FWHM/area and no reduced chi2 for ndf 0."""
+        cached = CachedFitResult.from_fit("pol1", chi2=1.0, ndf=0, status=0, parameters=(1.0, 2.0), errors=(0.1, 0.2))
+        self.assertIsNone(cached.reduced_chi2)
+        self.assertIsNone(cached.fwhm)
+        self.assertIsNone(cached.area)
+
+    def test_parameter_lines_pad_missing_names_and_errors(self):
+        """Unnamed parameters show as p[i] and missing errors as zero."""
+        cached = CachedFitResult.from_fit("pol1", chi2=1.0, ndf=1, status=0, parameters=(1.0, 2.0, 3.0), errors=(0.5,))
+        lines = list(FittingFeature._iter_parameter_lines("pol1", cached))
+        self.assertEqual(lines, [
+            "  a0 = 1.000000 ± 0.500000",
+            "  a1 = 2.000000 ± 0.000000",
+            "  p[2] = 3.000000 ± 0.000000",
+        ])
+
+    def test_to_dict_error(self):
+        """Failed results serialize only the error message."""
+        self.assertEqual(CachedFitResult(error="failed").to_dict(), {"error": "failed"})
+
+
+
+def _apply_text_edits(shown: str, edits: list[tuple[str, str, str]]) -> str:
+    """Apply Text.replace() edits to `shown` using Tk's "line.0"/"end-1c" indices."""
+    content = shown + "\n"  # Tk keeps a trailing newline
+
+    def offset(index: str) -> int:
+        if index == "end-1c":
+            return len(content) - 1
+        line = int(index.split(".")[0])
+        return sum(len(part) for part in content.splitlines(keepends=True)[:line - 1])
+
+    for start, end, chunk in edits:
+        content = content[:offset(start)] + chunk + content[offset(end):]
+    return content[:-1]
+
+
+class TestTextLineEdits(unittest.TestCase):
+    """Tests for the incremental results-text update."""
+
+    def test_edits_reproduce_new_text(self):
+        """Applying the edits to the old text yields the new text."""
+        old = "Fit Results (gaus)\nChi2: 1.2\nNDF: 10\n  Constant = 1.0\n  Mean = 662.0"
+        cases = [
+            "Fit Results (gaus)\nChi2: 1.5\nNDF: 10\n  Constant = 1.0\n  Mean = 661.9",
+            "Fit Results (pol1)\nChi2: 1.5\nNDF: 10",
+            old + "\n  Sigma = 2.0",
+            "Fit failed: bad range",
+            "",
+        ]
+        for new in cases:
+            with self.subTest(new=new):
+                self.assertEqual(_apply_text_edits(old, _text_line_edits(old, new)), new)
+
+    def test_changed_line_is_the_only_edit(self):
+        """A single changed line yields a single line replacement."""
+        edits = _text_line_edits("a\nb\nc", "a\nB\nc")
+        self.assertEqual(edits, [("2.0", "3.0", "B\n")])
+
+
+if __name__ == "__main__":
+    unittest.main()
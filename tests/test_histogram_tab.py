@@ -0,0 +1,138 @@
+"""
+Tests for histogram preview helpers that do not need a display or ROOT.
+
+Usage:
+    python -m pytest tests/test_histogram_tab.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from tab_managers.histogram_tab import HistogramPreviewRenderer, _axis_defaults_cache, _compute_axis_defaults
+
+
+class _Var:
+    """Minimal stand-in for a Tk variable."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class TestComputeAxisDefaults(unittest.TestCase):
+    """Tests for the preview's default axis ranges and labels."""
+
+    def test_histogram_ranges_and_titles(self):
+        """Ranges come from the axes, with positive minimums and 1.2x headroom."""
+        hist = MagicMock()
+        hist.GetXaxis.return_value.GetXmin.return_value = 0.0
+        hist.GetXaxis.return_value.GetXmax.return_value = 3000.0
+        hist.GetXaxis.return_value.GetTitle.return_value = "Energy (keV)"
+        hist.GetYaxis.return_value.GetTitle.return_value = "Counts"
+        hist.GetMinimum.return_value = 0.0
+        hist.GetMaximum.return_value = 500.0
+
+        defaults = _compute_axis_defaults(hist)
+
+        self.assertEqual(defaults["x_min"], 0.1)
+        self.assertEqual(defaults["x_max"], 3000.0)
+        self.assertEqual(defaults["y_min"], 0.1)
+        self.assertEqual(defaults["y_max"], 600.0)
+        self.assertEqual(defaults["x_label"], "Energy (keV)")
+        self.assertEqual(defaults["y_label"], "Counts")
+
+    def test_object_without_axes_uses_fallbacks(self):
+        """Objects without axes get the fixed fallback ranges and no labels."""
+        defaults = _compute_axis_defaults(object())
+        self.assertEqual(defaults["x_min"], 0.1)
+        self.assertAlmostEqual(defaults["x_max"], 100.1)
+        self.assertEqual((defaults["y_min"], defaults["y_max"]), (0.1, 120.0))
+        self.assertEqual((defaults["x_label"], defaults["y_label"]), ("", ""))
+
+    def test_defaults_are_cached_per_live_object(self):
+        """A histogram's axes are read once and its entry dies with it."""
+        import gc
+
+        hist = MagicMock()
+        hist.GetXaxis.return_value.GetXmin.return_value = 5.0
+        hist.GetMinimum.return_value = 1.0
+        hist.GetMaximum.return_value = 10.0
+        first = _compute_axis_defaults(hist)
+        first["x_min"] = -1.0  # Callers get a copy
+        second = _compute_axis_defaults(hist)
+
+        self.assertEqual(second["x_min"], 5.0)
+        hist.GetXaxis.assert_called_once()
+
+        key = id(hist)
+        del hist
+        gc.collect()
+        self.assertNotIn(key, _axis_defaults_cache)
+
+
+class TestAxisScroll(unittest.TestCase):
+    """Tests for the axis min/max wheel handlers."""
+
+    def setUp(self):
+        self.renderer = HistogramPreviewRenderer()
+        self.renderer._app = None  # No render scheduling
+
+    def test_min_steps_in_direction_and_stays_below_max(self):
+        """The min moves by one step and keeps 1.0 below the max."""
+        min_var, max_var = _Var("10.0"), _Var("20.0")
+        self.renderer._on_min_scroll(None, min_var, max_var, 0.1, 50.0, direction=-1)
+        self.assertEqual(min_var.get(), "9.5")
+        min_var.set("18.8")
+        self.renderer._on_min_scroll(None, min_var, max_var, 0.1, 50.0, direction=1)
+        self.assertEqual(min_var.get(), "19.0")
+
+    def test_max_clamps_to_limit(self):
+        """The max never scrolls past its limit."""
+        max_var, min_var = _Var("49.8"), _Var("1.0")
+        self.renderer._on_max_scroll(None, max_var, min_var, 0.1, 50.0, direction=1)
+        self.assertEqual(max_var.get(), "50.0")
+
+    def test_queued_ticks_apply_as_one_step(self):
+        """Ticks before the flush collapse into one net step per box."""
+        app = MagicMock()
+        self.renderer._app = app
+        self.renderer._pending_scroll = {}
+        self.renderer._scroll_flush_id = None
+        min_var, max_var = _Var("10.0"), _Var("40.0")
+        for direction in (1, 1, 1, -1):
+            self.renderer._queue_scroll(self.renderer._on_min_scroll, min_var, max_var, 0.1, 50.0, direction)
+        self.renderer._queue_scroll(self.renderer._on_max_scroll, max_var, min_var, 0.1, 50.0, -1)
+
+        app.after.assert_called_once()
+        self.assertEqual(min_var.get(), "10.0")
+        flush = app.after.call_args[0][1]
+        flush()
+        self.assertEqual(min_var.get(), "11.0")
+        self.assertEqual(max_var.get(), "39.5")
+        self.assertIsNone(self.renderer._scroll_flush_id)
+
+    def test_format_boxes_keep_min_below_max(self):
+        """Focus-out formatting keeps the min positive and the boxes apart."""
+        min_var, max_var = _Var("-3"), _Var("20")
+        self.renderer._format_min_box(min_var, max_var)
+        self.assertEqual(min_var.get(), "0.1")
+        max_var.set("0.05")
+        self.renderer._format_max_box(max_var, min_var)
+        self.assertEqual(max_var.get(), "1.1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+"""
+Tests for PeakFinderModule peak bookkeeping that does not need a display or ROOT.
+
+Usage:
+    python -m pytest tests/test_peak_manager.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.peak_manager import PeakFinderModule
+
+
+def _peak(energy: float, source: str, counts: float | None = 10.0) -> dict:
+    return {"energy": energy, "counts": counts, "source": source}
+
+
+class TestFindPeaks(unittest.TestCase):
+    """Tests for combining automatic results with manual peaks."""
+
+    def setUp(self):
+        self.module = PeakFinderModule()
+        self.module.current_hist = MagicMock()
+        self.module.automatic = MagicMock()
+
+    def test_manual_peaks_merge_into_energy_order(self):
+        """New automatic peaks replace old ones and interleave with manual peaks."""
+        self.module.peaks = [_peak(50.0, "automatic"), _peak(120.0, "manual"), _peak(900.0, "manual")]
+        self.module.automatic.find_peaks.return_value = [_peak(100.0, "automatic"), _peak(500.0, "automatic")]
+
+        self.module._find_peaks(None)
+
+        self.assertEqual(
+            [(p["energy"], p["source"]) for p in self.module.peaks],
+            [(100.0, "automatic"), (120.0, "manual"), (500.0, "automatic"), (900.0, "manual")],
+        )
+
+    def test_no_peaks_leaves_list_unchanged(self):
+        """Finding nothing with no manual peaks keeps the current list."""
+        self.module.peaks = [_peak(50.0, "automatic")]
+        self.module.automatic.find_peaks.return_value = []
+        self.module._find_peaks(None)
+        self.assertEqual(self.module.peaks, [_peak(50.0, "automatic")])
+
+
+class TestSinglePeakEdits(unittest.TestCase):
+    """Tests for adding and moving one peak in the sorted list."""
+
+    def setUp(self):
+        self.module = PeakFinderModule()
+        self.module.peaks = [_peak(100.0, "automatic"), _peak(300.0, "automatic"), _peak(500.0, "automatic")]
+
+    def test_manual_peak_is_inserted_in_order(self):
+        """A manual peak lands at its energy position."""
+        self.module._manual_peak_var = MagicMock()
+        self.module._manual_peak_var.get.return_value = " 400 "
+        self.module._add_manual_peak()
+        self.assertEqual([p["energy"] for p in self.module.peaks], [100.0, 300.0, 400.0, 500.0])
+        self.assertEqual(self.module.peaks[2]["source"], "manual")
+
+    def test_moved_peak_is_reinserted_in_order(self):
+        """Changing a peak's energy moves it to its new position."""
+        moved = self.module.peaks[0]
+        self.assertTrue(self.module.set_peak_energy_by_iid("0", 450.0))
+        self.assertEqual([p["energy"] for p in self.module.peaks], [300.0, 450.0, 500.0])
+        self.assertIs(self.module.peaks[1], moved)
+        self.assertFalse(self.module.set_peak_energy_by_iid("3", 1.0))
+
+
+class TestBinContent(unittest.TestCase):
+    """Tests for the cached bin-content lookup used when moving peaks."""
+
+    def _make_hist(self) -> MagicMock:
+        # 4 bins of width 10 from 0 to 40; bin i holds 100 * i
+        hist = MagicMock()
+        hist.GetNbinsX.return_value = 4
+        hist.GetBinLowEdge.side_effect = lambda i: 10.0 * (i - 1)
+        hist.GetBinContent.side_effect = lambda i: 100.0 * i
+        return hist
+
+    def test_matches_findbin_convention(self):
+        """Edges belong to the upper bin; outside values hit under- and overflow."""
+        module = PeakFinderModule()
+        module.current_hist = self._make_hist()
+        self.assertEqual(module._bin_content(0.0), 100.0)
+        self.assertEqual(module._bin_content(19.9), 200.0)
+        self.assertEqual(module._bin_content(20.0), 300.0)
+        self.assertEqual(module._bin_content(-1.0), 0.0)
+        self.assertEqual(module._bin_content(40.0), 500.0)
+
+    def test_histogram_is_read_once(self):
+        """Moving peaks reuses the lookup until the histogram changes."""
+        module = PeakFinderModule()
+        module.current_hist = hist = self._make_hist()
+        module.peaks = [_peak(5.0, "automatic")]
+        module.set_peak_energy_by_iid("0", 25.0)
+        module.set_peak_energy_by_iid("0", 35.0)
+        self.assertEqual(module.peaks[0]["counts"], 400.0)
+        self.assertEqual(hist.GetBinContent.call_count, 6)
+        hist.FindBin.assert_not_called()
+
+        module.current_hist = other = self._make_hist()
+        module.set_peak_energy_by_iid("0", 15.0)
+        other.GetNbinsX.assert_called_once()
+
+
+class _FakeTree:
+    """Minimal Treeview stand-in tracking row order, values and selection."""
+
+    def __init__(self):
+        self.rows: list[str] = []
+        self.values: dict[str, tuple] = {}
+        self.selected: list[str] = []
+        self.calls = 0
+
+    def insert(self, parent, index, iid, values):
+        self.calls += 1
+        self.rows.insert(index, iid)
+        self.values[iid] = values
+
+    def item(self, iid, values):
+        self.calls += 1
+        self.values[iid] = values
+
+    def move(self, iid, parent, index):
+        self.calls += 1
+        self.rows.remove(iid)
+        self.rows.insert(index, iid)
+
+    def delete(self, iid):
+        self.calls += 1
+        self.rows.remove(iid)
+        del self.values[iid]
+        if iid in self.selected:
+            self.selected.remove(iid)
+
+    def selection(self):
+        return tuple(self.selected)
+
+    def shown(self) -> list[tuple]:
+        return [self.values[iid] for iid in self.rows]
+
+
+class TestUpdatePeaksDisplay(unittest.TestCase):
+    """Tests for the incremental Treeview refresh."""
+
+    def setUp(self):
+        self.module = PeakFinderModule()
+        self.module._peaks_tree = self.tree = _FakeTree()
+        self.module.peaks = [_peak(100.0, "automatic"), _peak(300.0, "automatic", None), _peak(500.0, "manual")]
+        self.module._update_peaks_display()
+
+    def test_only_changed_rows_are_touched(self):
+        """Unchanged rows get no Tk call; changed and stale rows get one each."""
+        self.assertEqual(self.tree.shown()[1], ("300.0", "", "automatic"))
+        self.tree.calls = 0
+        self.module.peaks[1]["energy"] = 320.0
+        del self.module.peaks[2]
+        self.module._update_peaks_display()
+        self.assertEqual(self.tree.calls, 2)
+        self.assertEqual(self.tree.shown(), [("100.0", "10", "automatic"), ("320.0", "", "automatic")])
+
+    def test_removing_selected_middle_row_keeps_selection_on_picked_peaks(self):
+        """Deleting a selected row leaves no other peak selected."""
+        first, middle, last = self.tree.rows
+        self.tree.selected = [middle]
+        self.module.remove_selected_peak()
+
+        self.assertEqual([p["energy"] for p in self.module.peaks], [100.0, 500.0])
+        self.assertEqual(self.tree.rows, [first, last])
+        self.assertEqual(self.tree.selection(), ())
+        # A second Delete with nothing selected removes nothing
+        self.module.remove_selected_peak()
+        self.assertEqual(len(self.module.peaks), 2)
+
+    def test_selection_follows_a_moved_peak(self):
+        """A selected peak moved past others keeps its row and selection."""
+        selected = self.tree.rows[0]
+        self.tree.selected = [selected]
+        self.assertTrue(self.module.set_peak_energy_by_iid(selected, 400.0))
+
+        self.assertEqual(self.tree.rows.index(selected), 1)
+        self.assertEqual(self.tree.selection(), (selected,))
+        self.assertEqual(self.module.get_peak_energy_by_iid(selected), 400.0)
+        self.assertEqual([v[0] for v in self.tree.shown()], ["300.0", "400.0", "500.0"])
+
+    def test_new_peak_is_inserted_at_its_position(self):
+        """An added peak's row goes to its place in energy order."""
+        self.module._manual_peak_var = MagicMock()
+        self.module._manual_peak_var.get.return_value = "200"
+        self.module._add_manual_peak()
+        self.assertEqual([v[0] for v in self.tree.shown()], ["100.0", "200.0", "300.0", "500.0"])
+
+    def test_formatted_rows_are_reused_until_values_change(self):
+        """An unchanged peak keeps its formatted row; an edited one is reformatted."""
+        peak = self.module.peaks[2]
+        iid = self.tree.rows[2]
+        row = self.module._last_rendered[iid]
+        self.module._update_peaks_display()
+        self.assertIs(self.module._last_rendered[iid], row)
+
+        peak["counts"] = None
+        self.module._update_peaks_display()
+        self.assertEqual(self.module._last_rendered[iid], ("500.0", "", "manual"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for HistogramRenderer label rendering without a display or ROOT.
+
+Usage:
+    python -m pytest tests/test_preview_manager.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.preview_manager import HistogramRenderer, _options_key
+
+
+def _make_label(width: int = 800, height: int = 450) -> MagicMock:
+    label = MagicMock()
+    label.winfo_width.return_value = width
+    label.winfo_height.return_value = height
+    return label
+
+
+class TestOptionsKey(unittest.TestCase):
+    """Tests for the preview cache key of normalized options."""
+
+    def test_key_ignores_input_order_and_is_hashable(self):
+        """Option dicts that differ only in key order normalize to the same key."""
+        first = {"xmin": 1.0, "xmax": 2.0, "logy": True, "markers": [3.0, 4.0]}
+        second = {"markers": [3.0, 4.0], "logy": True, "xmax": 2.0, "xmin": 1.0}
+        key = _options_key(HistogramRenderer._normalize_options(first))
+        self.assertEqual(key, _options_key(HistogramRenderer._normalize_options(second)))
+        self.assertIn(("markers", (3.0, 4.0)), key)
+        hash(key)
+
+
+class TestRenderIntoLabel(unittest.TestCase):
+    """Tests for reusing rendered previews."""
+
+    def setUp(self):
+        self.renderer = HistogramRenderer()
+        self.renderer._feature = MagicMock()
+        self.renderer._feature.render_to_temp_image.return_value = "/tmp/preview.png"
+        patcher = patch("modules.preview_manager.tk.PhotoImage", side_effect=lambda file: MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_request_reuses_image(self):
+        """A repeated render with the same histogram, size and options is not redrawn."""
+        hist, label = MagicMock(), _make_label()
+        options = {"logy": True, "markers": [661.7, 1173.2]}
+        self.renderer.render_into_label(None, hist, label, options)
+        first = label.image
+        self.renderer.render_into_label(None, hist, label, {"logy": True, "markers": [661.7, 1173.2]})
+
+        self.renderer._feature.render_to_temp_image.assert_called_once()
+        self.assertIs(label.image, first)
+
+    def test_changed_options_or_histogram_render_again(self):
+        """Different options or another histogram miss the cache."""
+        hist, label = MagicMock(), _make_label()
+        self.renderer.render_into_label(None, hist, label, {"logy": True})
+        self.renderer.render_into_label(None, hist, label, {"logy": False})
+        self.renderer.render_into_label(None, MagicMock(), label, {"logy": True})
+        self.assertEqual(self.renderer._feature.render_to_temp_image.call_count, 3)
+
+    def test_cache_is_bounded(self):
+        """Only the most recent previews are kept."""
+        label = _make_label()
+        for _ in range(HistogramRenderer._IMAGE_CACHE_SIZE + 3):
+            self.renderer.render_into_label(None, MagicMock(), label)
+        self.assertEqual(len(self.renderer._image_cache), HistogramRenderer._IMAGE_CACHE_SIZE)
+
+
+class TestRenderIntoLabelAsync(unittest.TestCase):
+    """Tests for coalescing scheduled renders per label."""
+
+    def test_newer_request_replaces_pending_one(self):
+        """Only the latest scheduled render of a label runs."""
+        renderer = HistogramRenderer()
+        renderer.render_into_label = MagicMock()
+        label = _make_label()
+        label._hist_pending = None
+        label.after.side_effect = ["after#1", "after#2"]
+
+        renderer.render_into_label_async(None, "h1", label, delay_ms=80)
+        stale = label.after.call_args[0][1]
+        renderer.render_into_label_async(None, "h2", label, delay_ms=80)
+        latest = label.after.call_args[0][1]
+
+        label.after_cancel.assert_called_once_with("after#1")
+        stale()
+        renderer.render_into_label.assert_not_called()
+        latest()
+        renderer.render_into_label.assert_called_once_with(None, "h2", label, None)
+        self.assertIsNone(label._hist_pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
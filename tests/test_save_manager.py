@@ -0,0 +1,92 @@
+"""
+Tests for SaveManager fit-result exports that do not need a display or ROOT.
+
+Usage:
+    python -m pytest tests/test_save_manager.py -v
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.fit_module import CachedFitResult
+from modules.save_manager import SaveManager
+
+
+class _Var:
+    """Minimal stand-in for a Tk variable."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def _fit_state(fitted: str, shown: str) -> dict:
+    """A fit state whose results were fitted with `fitted` while the dropdown shows `shown`."""
+    cached = CachedFitResult.from_fit(
+        fitted, chi2=8.0, ndf=4, status=0, parameters=(100.0, 662.0, 2.0), errors=(1.0, 0.1, 0.05),
+    )
+    return {
+        "fit_func_var": _Var(shown),
+        "energy_var": _Var("662.00"),
+        "width_var": _Var("20.0"),
+        "cached_results": cached,
+    }
+
+
+class TestFitResultExports(unittest.TestCase):
+    """Tests for labelling exported fits with the function that was fitted."""
+
+    def setUp(self):
+        self.manager = SaveManager()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_csv_uses_fitted_function_after_dropdown_change(self):
+        """A Gaussian fit stays labelled gaus with its FWHM after switching to landau."""
+        path = os.path.join(self.tmpdir.name, "fits.csv")
+        self.manager.export_fit_results_csv({1: _fit_state("gaus", "landau")}, filepath=path)
+        with open(path, newline="", encoding="utf-8") as f:
+            row = next(csv.DictReader(f))
+        self.assertEqual(row["Fit_Function"], "gaus")
+        self.assertEqual(row["FWHM_keV"], "4.710")
+
+    def test_json_annotations_follow_fitted_function(self):
+        """Landau annotations appear only for fits made with landau."""
+        path = os.path.join(self.tmpdir.name, "fits.json")
+        self.manager.export_fit_results_json(
+            {1: _fit_state("gaus", "landau"), 2: _fit_state("landau", "gaus")}, filepath=path,
+        )
+        with open(path, encoding="utf-8") as f:
+            gaus_fit, landau_fit = json.load(f)["fits"]
+        self.assertEqual(gaus_fit["fit_function"], "gaus")
+        self.assertIn("fwhm_keV", gaus_fit["annotations"])
+        self.assertEqual(landau_fit["fit_function"], "landau")
+        self.assertEqual(landau_fit["annotations"], {"most_probable_value_keV": 662.0, "width_keV": 2.0})
+
+    def test_results_without_function_fall_back_to_dropdown(self):
+        """Error results carry no function, so the dropdown labels them."""
+        fit_state = _fit_state("gaus", "pol1")
+        fit_state["cached_results"] = CachedFitResult(error="failed")
+        path = os.path.join(self.tmpdir.name, "fits.json")
+        self.manager.export_fit_results_json({1: fit_state}, filepath=path)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["fits"][0]["fit_function"], "pol1")
+
+
+if __name__ == "__main__":
+    unittest.main()